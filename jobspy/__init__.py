@@ -21,6 +21,7 @@ from jobspy.util import (
     map_str_to_site,
     convert_to_annual,
     desired_order,
+    release_session,
 )
 from jobspy.ziprecruiter import ZipRecruiter
 
@@ -99,7 +100,11 @@ def scrape_jobs(
     def scrape_site(site: Site) -> Tuple[str, JobResponse]:
         scraper_class = SCRAPER_MAPPING[site]
         scraper = scraper_class(proxies=proxies, ca_cert=ca_cert)
-        scraped_data: JobResponse = scraper.scrape(scraper_input)
+        try:
+            scraped_data: JobResponse = scraper.scrape(scraper_input)
+        finally:
+            # Hand the session's open connections to the next scrape of this site
+            release_session(getattr(scraper, "session", None))
         cap_name = site.value.capitalize()
         site_name = "ZipRecruiter" if cap_name == "Zip_recruiter" else cap_name
         create_logger(site_name).info(f"finished scraping")
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import logging
 import random
 import time
 
@@ -35,7 +36,11 @@ class BaytScraper(Scraper):
     def scrape(self, scraper_input: ScraperInput) -> JobResponse:
         self.scraper_input = scraper_input
         self.session = create_session(
-            proxies=self.proxies, ca_cert=self.ca_cert, is_tls=False, has_retry=True
+            site=self.site,
+            proxies=self.proxies,
+            ca_cert=self.ca_cert,
+            is_tls=False,
+            has_retry=True,
         )
         job_list: list[JobPost] = []
         page = 1
@@ -49,7 +54,8 @@ class BaytScraper(Scraper):
             if not job_elements:
                 break
 
-            if job_elements:
+            # prettify() re-serializes the element; only pay for it when debugging
+            if job_elements and log.isEnabledFor(logging.DEBUG):
                 log.debug(
                     "First job element snippet:\n" + job_elements[0].prettify()[:500]
                 )
@@ -62,7 +68,7 @@ class BaytScraper(Scraper):
                         job_list.append(job_post)
                         if len(job_list) >= results_wanted:
                             break
-                    else:
+                    elif log.isEnabledFor(logging.DEBUG):
                         log.debug(
                             "Extraction returned None. Job snippet:\n"
                             + job.prettify()[:500]
@@ -91,7 +97,7 @@ class BaytScraper(Scraper):
             response.raise_for_status()
             soup = BeautifulSoup(response.text, "html.parser")
             job_listings = soup.find_all("li", attrs={"data-js-job": ""})
-            log.debug(f"Found {len(job_listings)} job listing elements")
+            log.debug("Found %d job listing elements", len(job_listings))
             return job_listings
         except Exception as e:
             log.error(f"Bayt: Error fetching jobs - {str(e)}")
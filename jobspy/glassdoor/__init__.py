@@ -61,7 +61,7 @@ class Glassdoor(Scraper):
         self.base_url = self.scraper_input.country.get_glassdoor_url()
 
         self.session = create_session(
-            proxies=self.proxies, ca_cert=self.ca_cert, has_retry=True
+            site=self.site, proxies=self.proxies, ca_cert=self.ca_cert, has_retry=True
         )
         token = self._get_csrf_token()
         headers["gd-csrf-token"] = token if token else fallback_token
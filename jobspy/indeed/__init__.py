@@ -36,7 +36,7 @@ class Indeed(Scraper):
         super().__init__(Site.INDEED, proxies=proxies)
 
         self.session = create_session(
-            proxies=self.proxies, ca_cert=ca_cert, is_tls=False
+            site=self.site, proxies=self.proxies, ca_cert=ca_cert, is_tls=False
         )
         self.scraper_input = None
         self.jobs_per_page = 100
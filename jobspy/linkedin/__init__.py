@@ -57,6 +57,7 @@ class LinkedIn(Scraper):
         """
         super().__init__(Site.LINKEDIN, proxies=proxies, ca_cert=ca_cert)
         self.session = create_session(
+            site=self.site,
             proxies=self.proxies,
             ca_cert=ca_cert,
             is_tls=False,
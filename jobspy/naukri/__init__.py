@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import logging
 import math
 import random
 import time
@@ -51,6 +52,7 @@ class Naukri(Scraper):
         """
         super().__init__(Site.NAUKRI, proxies=proxies, ca_cert=ca_cert)
         self.session = create_session(
+            site=self.site,
             proxies=self.proxies,
             ca_cert=ca_cert,
             is_tls=False,
@@ -106,7 +108,7 @@ class Naukri(Scraper):
 
             params = {k: v for k, v in params.items() if v is not None}
             try:
-                log.debug(f"Sending request to {self.base_url} with params: {params}")
+                log.debug("Sending request to %s with params: %s", self.base_url, params)
                 response = self.session.get(self.base_url, params=params, timeout=10)
                 if response.status_code not in range(200, 400):
                     err = f"Naukri API response status code {response.status_code} - {response.text}"
@@ -127,7 +129,7 @@ class Naukri(Scraper):
                 if not job_id or job_id in seen_ids:
                     continue
                 seen_ids.add(job_id)
-                log.debug(f"Processing job ID: {job_id}")
+                log.debug("Processing job ID: %s", job_id)
 
                 try:
                     fetch_desc = scraper_input.linkedin_fetch_description
@@ -204,7 +206,7 @@ class Naukri(Scraper):
             vacancy_count=vacancy_count,
             work_from_home_type=work_from_home_type,
         )
-        log.debug(f"Processed job: {title} at {company}")
+        log.debug("Processed job: %s at %s", title, company)
         return job_post
 
     def _get_location(self, placeholders: list[dict]) -> Location:
@@ -219,7 +221,8 @@ class Naukri(Scraper):
                 city = parts[0] if parts else None
                 state = parts[1] if len(parts) > 1 else None
                 location = Location(city=city, state=state, country=Country.INDIA)
-                log.debug(f"Parsed location: {location.display_location()}")
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug("Parsed location: %s", location.display_location())
                 break
         return location
 
@@ -249,14 +252,14 @@ class Naukri(Scraper):
                         min_salary *= 10000000  # 1 Crore = 10,000,000 INR
                         max_salary *= 10000000
 
-                    log.debug(f"Parsed salary: {min_salary} - {max_salary} INR")
+                    log.debug("Parsed salary: %s - %s INR", min_salary, max_salary)
                     return Compensation(
                         min_amount=int(min_salary),
                         max_amount=int(max_salary),
                         currency=currency,
                     )
                 else:
-                    log.debug(f"Could not parse salary: {salary_text}")
+                    log.debug("Could not parse salary: %s", salary_text)
                     return None
         return None
 
@@ -278,11 +281,11 @@ class Naukri(Scraper):
             if match:
                 days = int(match.group(1))
                 parsed_date = (today - timedelta(days = days)).date()
-                log.debug(f"Date parsed: {days} days ago -> {parsed_date}")
+                log.debug("Date parsed: %s days ago -> %s", days, parsed_date)
                 return parsed_date
         elif created_date:
             parsed_date = datetime.fromtimestamp(created_date / 1000).date()
-            log.debug(f"Date parsed from timestamp: {parsed_date}")
+            log.debug("Date parsed from timestamp: %s", parsed_date)
             return parsed_date
         log.debug("No date parsed")
         return None
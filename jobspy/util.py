@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import re
+import threading
 from itertools import cycle
 
 import numpy as np
@@ -103,8 +104,24 @@ class TLSRotating(RotatingProxySession, tls_client.Session):
         return response
 
 
+# Idle sessions kept between scrapes, keyed by their settings, so their
+# keep-alive connections (and TLS handshakes) are reused by the next scraper
+_idle_sessions: dict[tuple, list] = {}
+_idle_sessions_lock = threading.Lock()
+MAX_IDLE_SESSIONS = 4
+
+
+def _session_key(site, proxies, ca_cert, is_tls, has_retry, delay, clear_cookies) -> tuple:
+    if isinstance(proxies, list):
+        proxies = tuple(proxies)
+    elif isinstance(proxies, dict):
+        proxies = tuple(sorted(proxies.items()))
+    return site, proxies, ca_cert, is_tls, has_retry, delay, clear_cookies
+
+
 def create_session(
     *,
+    site: Site | None = None,
     proxies: dict | str | None = None,
     ca_cert: str | None = None,
     is_tls: bool = True,
@@ -114,8 +131,17 @@ def create_session(
 ) -> requests.Session:
     """
     Creates a requests session with optional tls, proxy, and retry settings.
+    Reuses a session handed back by release_session if one for the same site and
+    settings is idle; sessions are only pooled when the site is given.
     :return: A session object
     """
+    key = _session_key(site, proxies, ca_cert, is_tls, has_retry, delay, clear_cookies)
+    if site is not None:
+        with _idle_sessions_lock:
+            idle = _idle_sessions.get(key)
+            if idle:
+                return idle.pop()
+
     if is_tls:
         session = TLSRotating(proxies=proxies)
     else:
@@ -129,9 +155,32 @@ def create_session(
     if ca_cert:
         session.verify = ca_cert
 
+    if site is not None:
+        session.pool_key = key
+        # Scrapers add their own headers; release_session restores these
+        session.pool_headers = dict(session.headers)
     return session
 
 
+def release_session(session) -> None:
+    """
+    Returns a session from create_session for reuse by a later scraper of the
+    same site. Headers are reset to the session defaults and cookies cleared, so
+    only the open connections carry over. Sessions beyond MAX_IDLE_SESSIONS per
+    key are dropped.
+    """
+    key = getattr(session, "pool_key", None)
+    if key is None:
+        return
+    session.headers.clear()
+    session.headers.update(session.pool_headers)
+    session.cookies.clear()
+    with _idle_sessions_lock:
+        idle = _idle_sessions.setdefault(key, [])
+        if len(idle) < MAX_IDLE_SESSIONS:
+            idle.append(session)
+
+
 def set_logger_level(verbose: int):
     """
     Adjusts the logger's level. This function allows the logging level to be changed at runtime.
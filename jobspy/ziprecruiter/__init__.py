@@ -46,7 +46,7 @@ class ZipRecruiter(Scraper):
         super().__init__(Site.ZIP_RECRUITER, proxies=proxies)
 
         self.scraper_input = None
-        self.session = create_session(proxies=proxies, ca_cert=ca_cert)
+        self.session = create_session(site=self.site, proxies=proxies, ca_cert=ca_cert)
         self.session.headers.update(headers)
         self._get_cookies()
 
@@ -9,13 +9,32 @@ __version__ = "2.0.0"
 __author__ = "LokerPuller Team"
 __description__ = "Southeast Asian Job Scraper and Management System"
 
-# Core imports
-from .core.scraper import JobScraper
-from .core.scheduler import JobScheduler
-from .database.manager import DatabaseManager
+# Core exports, imported on first access so ``import lokerpuller`` stays light
+_LAZY_EXPORTS = {
+    "JobScraper": ".core.scraper",
+    "JobScheduler": ".core.scheduler",
+    "DatabaseManager": ".database.manager",
+}
 
 __all__ = [
     "JobScraper",
     "JobScheduler", 
     "DatabaseManager",
-] 
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """Import core classes lazily on first attribute access (PEP 562)."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    from importlib import import_module
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Include lazily exported names in dir(lokerpuller)."""
+    return sorted(list(globals()) + __all__)
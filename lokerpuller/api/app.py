@@ -4,24 +4,97 @@ LokerPuller REST API
 Flask API for job board frontend with filtering, sorting, and manual scraping capabilities.
 """
 
+import base64
+import binascii
+import hashlib
 import os
 import threading
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Tuple
 
-from flask import Flask, request, jsonify, render_template, send_from_directory
+import orjson
+from flask import Flask, Response, request, jsonify, render_template, send_from_directory, stream_with_context
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
+from flask_compress import Compress
 
 from ..database.manager import DatabaseManager
 from ..core.scraper import JobScraper
-from ..utils.logging import get_logger
+from ..utils.logging import exit_cleanly_on_sigterm, get_logger, setup_logging
 from ..config.settings import get_settings
 
 
+ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Serialize the types Flask's default provider handles but orjson does not."""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if hasattr(obj, '__html__'):
+        return str(obj.__html__())
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_json(obj: Any) -> bytes:
+    """Serialize an object to JSON bytes with the API's orjson options."""
+    return orjson.dumps(obj, default=_orjson_default, option=ORJSON_OPTIONS)
+
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson's C serializer."""
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return dumps_json(obj).decode()
+    
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+    
+    def response(self, *args: Any, **kwargs: Any):
+        # Hand orjson's bytes straight to the response instead of round-tripping through str
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dumps_json(obj), mimetype='application/json')
+
+
+# Manual scrapes allowed to be running or queued at once
+MAX_PENDING_SCRAPES = 2
+
+# Query parameters accepted as /api/jobs filters
+JOB_FILTER_PARAMS = (
+    'title', 'company', 'location', 'country', 'job_type', 'site',
+    'is_remote', 'min_salary', 'max_salary', 'days_old'
+)
+
+
+def encode_cursor(scraped_at: str, job_id: int) -> str:
+    """Encode the keyset position of a job row as an opaque pagination cursor."""
+    return base64.urlsafe_b64encode(f"{scraped_at}|{job_id}".encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[str, int]:
+    """
+    Decode a pagination cursor produced by encode_cursor.
+    
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        scraped_at, last_id = base64.urlsafe_b64decode(cursor.encode()).decode().rsplit('|', 1)
+        return scraped_at, int(last_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
 def create_app() -> Flask:
     """Create and configure the Flask application."""
     settings = get_settings()
     
+    # Per-request limits, captured once so handlers read closure locals
+    max_results_per_request = settings.max_results_per_request
+    cache_ttl = settings.cache_ttl
+    
     # Create Flask app with proper template and static folders
     template_folder = os.path.join(os.path.dirname(__file__), '..', 'web', 'templates')
     static_folder = os.path.join(os.path.dirname(__file__), '..', 'web', 'static')
@@ -29,14 +102,50 @@ def create_app() -> Flask:
     app = Flask(__name__, 
                 template_folder=template_folder, 
                 static_folder=static_folder)
+    app.json = OrjsonProvider(app)
     CORS(app)  # Enable CORS for frontend requests
     
+    # Compress JSON responses; streamed /api/jobs bodies are deflated chunk by chunk
+    app.config['COMPRESS_MIMETYPES'] = ['application/json']
+    app.config['COMPRESS_ALGORITHM'] = ['gzip', 'deflate']
+    app.config['COMPRESS_ALGORITHM_STREAMING'] = ['deflate']
+    app.config['COMPRESS_LEVEL'] = 4
+    app.config['COMPRESS_DEFLATE_LEVEL'] = 4
+    Compress(app)
+    
     # Setup logging
     logger = get_logger("API")
     
     # Initialize components
     db_manager = DatabaseManager(settings.db_path)
-    scraper = JobScraper()
+    scraper = JobScraper(db_manager)
+    
+    # Manual scrapes run one at a time; a small backlog is queued and the rest rejected
+    scrape_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='scrape')
+    app.extensions['scrape_executor'] = scrape_executor
+    scrape_lock = threading.Lock()
+    pending_scrapes = 0
+    
+    def cached_json_response(key: str, loader) -> Response:
+        """
+        Serve a cached aggregate with an ETag derived from its serialized body.
+        
+        The body is built once per cache load, and the cache is dropped by the
+        database manager's write paths, so repeated requests run no query at
+        all; clients revalidating with a matching If-None-Match get an empty 304.
+        """
+        def load_body() -> Tuple[bytes, str]:
+            body = dumps_json(loader())
+            return body, hashlib.blake2b(body, digest_size=8).hexdigest()
+        
+        body, etag = db_manager.get_cached(key, load_body, cache_ttl)
+        
+        if etag in request.if_none_match:
+            response = Response(status=304)
+        else:
+            response = Response(body, mimetype='application/json')
+        response.set_etag(etag)
+        return response
     
     @app.route('/')
     def index():
@@ -47,81 +156,84 @@ def create_app() -> Flask:
     def get_jobs():
         """Get jobs with filtering and pagination."""
         try:
-            # Parse query parameters
-            filters = {
-                'title': request.args.get('title'),
-                'company': request.args.get('company'),
-                'location': request.args.get('location'),
-                'country': request.args.get('country'),
-                'job_type': request.args.get('job_type'),
-                'site': request.args.get('site'),
-                'is_remote': request.args.get('is_remote'),
-                'min_salary': request.args.get('min_salary'),
-                'max_salary': request.args.get('max_salary'),
-                'days_old': request.args.get('days_old'),
-                'sort_by': request.args.get('sort_by', 'scraped_at'),
-                'sort_order': request.args.get('sort_order', 'desc')
-            }
-            
-            # Remove None values
-            filters = {k: v for k, v in filters.items() if v is not None}
+            # Parse query parameters, keeping only the filters actually supplied
+            args = request.args
+            filters = {key: args[key] for key in JOB_FILTER_PARAMS if key in args}
+            filters['sort_by'] = args.get('sort_by', 'scraped_at')
+            filters['sort_order'] = args.get('sort_order', 'desc')
             
             # Parse pagination
             page = int(request.args.get('page', 1))
-            per_page = min(int(request.args.get('per_page', 20)), settings.max_results_per_request)
+            per_page = min(int(request.args.get('per_page', 20)), max_results_per_request)
             
-            # Search jobs
-            jobs, total_count = db_manager.search_jobs(filters, page, per_page)
+            # Keyset pagination is available for the default newest-first ordering
+            cursor = request.args.get('cursor')
+            seekable = filters['sort_by'] == 'scraped_at' and filters['sort_order'].lower() == 'desc'
             
-            # Format jobs for display
-            formatted_jobs = []
-            for job in jobs:
-                # Format salary display
-                if job.get('min_amount') and job.get('max_amount'):
-                    job['salary_display'] = f"{job.get('currency', 'USD')} {job['min_amount']:,.0f} - {job['max_amount']:,.0f}"
-                elif job.get('min_amount'):
-                    job['salary_display'] = f"{job.get('currency', 'USD')} {job['min_amount']:,.0f}+"
-                else:
-                    job['salary_display'] = "Not specified"
+            # Search jobs; the query runs now so SQL errors still produce a 500 response
+            if cursor:
+                if not seekable:
+                    return jsonify({'error': 'cursor requires sort_by=scraped_at and sort_order=desc'}), 400
+                try:
+                    after = decode_cursor(cursor)
+                except ValueError as e:
+                    return jsonify({'error': str(e)}), 400
+                
+                # Seek pages skip the COUNT(*); fetch one extra row to learn whether another page exists
+                total_count = None
+                columns, rows = db_manager.iter_search_rows(filters, per_page=per_page + 1, after=after, as_json=True)
+            else:
+                columns, rows, total_count = db_manager.search_rows_with_total(filters, page, per_page, as_json=True)
+            
+            # Column positions needed for the cursor, looked up once instead of per row
+            scraped_at_index = columns.index('scraped_at')
+            id_index = columns.index('id')
+            
+            def generate():
+                """Stream the response one job at a time instead of building the full payload."""
+                yield b'{"jobs":['
+                
+                last_row = None
+                has_next = False
+                try:
+                    for count, row in enumerate(rows):
+                        if count == per_page:
+                            has_next = True
+                            break
+                        # SQLite already serialized the job; no per-row dict or encoder pass here
+                        yield (b',' if count else b'') + row[0].encode()
+                        last_row = row
+                except Exception as e:
+                    # The status line is already sent, so all we can do is log and close the document
+                    logger.error(f"Error streaming get_jobs: {e}")
                 
-                # Format dates
-                if job.get('date_posted'):
-                    try:
-                        if isinstance(job['date_posted'], str):
-                            job['date_posted_formatted'] = datetime.strptime(job['date_posted'], '%Y-%m-%d').strftime('%B %d, %Y')
-                        else:
-                            job['date_posted_formatted'] = job['date_posted'].strftime('%B %d, %Y')
-                    except:
-                        job['date_posted_formatted'] = job['date_posted']
+                # Calculate pagination
+                if total_count is None:
+                    pagination = {
+                        'per_page': per_page,
+                        'has_next': has_next,
+                        'has_prev': True
+                    }
                 else:
-                    job['date_posted_formatted'] = "Not specified"
+                    total_pages = (total_count + per_page - 1) // per_page
+                    has_next = page < total_pages
+                    pagination = {
+                        'page': page,
+                        'per_page': per_page,
+                        'total_count': total_count,
+                        'total_pages': total_pages,
+                        'has_next': has_next,
+                        'has_prev': page > 1
+                    }
                 
-                if job.get('scraped_at'):
-                    try:
-                        if isinstance(job['scraped_at'], str):
-                            job['scraped_at_formatted'] = datetime.strptime(job['scraped_at'], '%Y-%m-%d %H:%M:%S').strftime('%B %d, %Y at %I:%M %p')
-                        else:
-                            job['scraped_at_formatted'] = job['scraped_at'].strftime('%B %d, %Y at %I:%M %p')
-                    except:
-                        job['scraped_at_formatted'] = job['scraped_at']
+                if seekable and has_next and last_row:
+                    pagination['next_cursor'] = encode_cursor(last_row[scraped_at_index], last_row[id_index])
+                else:
+                    pagination['next_cursor'] = None
                 
-                formatted_jobs.append(job)
+                yield b'],"pagination":' + dumps_json(pagination) + b',"filters":' + dumps_json(filters) + b'}'
             
-            # Calculate pagination
-            total_pages = (total_count + per_page - 1) // per_page
-            
-            return jsonify({
-                'jobs': formatted_jobs,
-                'pagination': {
-                    'page': page,
-                    'per_page': per_page,
-                    'total_count': total_count,
-                    'total_pages': total_pages,
-                    'has_next': page < total_pages,
-                    'has_prev': page > 1
-                },
-                'filters': filters
-            })
+            return Response(stream_with_context(generate()), mimetype='application/json')
             
         except Exception as e:
             logger.error(f"Error in get_jobs: {e}")
@@ -131,8 +243,7 @@ def create_app() -> Flask:
     def get_job_stats():
         """Get database statistics."""
         try:
-            stats = db_manager.get_statistics()
-            return jsonify(stats)
+            return cached_json_response('statistics', db_manager.get_statistics)
         except Exception as e:
             logger.error(f"Error in get_job_stats: {e}")
             return jsonify({'error': str(e)}), 500
@@ -141,8 +252,9 @@ def create_app() -> Flask:
     def get_filter_options():
         """Get available filter options."""
         try:
-            options = db_manager.get_filter_options()
-            return jsonify(options)
+            response = cached_json_response('filter_options', db_manager.get_filter_options)
+            response.headers['Cache-Control'] = f'public, max-age={cache_ttl}'
+            return response
         except Exception as e:
             logger.error(f"Error in get_filter_options: {e}")
             return jsonify({'error': str(e)}), 500
@@ -158,13 +270,19 @@ def create_app() -> Flask:
             
             search_term = data.get('search_term')
             location = data.get('location') or data.get('country', 'Singapore')
-            results = min(int(data.get('results', 25)), settings.max_results_per_request)
+            results = min(int(data.get('results', 25)), max_results_per_request)
             sites = data.get('sites', ['indeed', 'linkedin'])
             job_type = data.get('job_type')
             
             if not search_term:
                 return jsonify({'error': 'search_term is required'}), 400
             
+            nonlocal pending_scrapes
+            with scrape_lock:
+                if pending_scrapes >= MAX_PENDING_SCRAPES:
+                    return jsonify({'error': 'Too many scraping jobs in progress, try again later'}), 429
+                pending_scrapes += 1
+            
             logger.info(f"Manual scraping triggered: {search_term} in {location}")
             
             def run_scraping():
@@ -181,10 +299,18 @@ def create_app() -> Flask:
                 except Exception as e:
                     logger.error(f"Manual scraping failed: {e}")
             
-            # Start scraping in background
-            thread = threading.Thread(target=run_scraping)
-            thread.daemon = True
-            thread.start()
+            def finish_scraping(_future):
+                nonlocal pending_scrapes
+                with scrape_lock:
+                    pending_scrapes -= 1
+            
+            # Queue scraping on the background executor
+            try:
+                future = scrape_executor.submit(run_scraping)
+            except RuntimeError:
+                finish_scraping(None)
+                raise
+            future.add_done_callback(finish_scraping)
             
             return jsonify({
                 'message': 'Scraping started successfully',
@@ -227,49 +353,52 @@ def create_app() -> Flask:
         """Serve static files."""
         return send_from_directory(app.static_folder, filename)
     
-    def print_startup_info():
-        """Print startup information."""
-        print("🚀 LokerPuller API Server Starting...")
-        print("=" * 60)
-        print(f"📍 Server: http://{settings.api_host}:{settings.api_port}")
-        print(f"🗄️  Database: {settings.db_path}")
-        print(f"📝 Logs: {settings.log_path}")
-        print("")
-        print("🌐 Available URLs:")
-        print(f"   Web Interface: http://{settings.api_host}:{settings.api_port}")
-        print(f"   API Base: http://{settings.api_host}:{settings.api_port}/api/")
-        print(f"   Health Check: http://{settings.api_host}:{settings.api_port}/api/health")
-        print("")
-        print("🔧 API Endpoints:")
-        print(f"   GET  /api/jobs          - Search jobs")
-        print(f"   GET  /api/jobs/stats    - Database statistics")
-        print(f"   GET  /api/jobs/filters  - Filter options")
-        print(f"   POST /api/scrape        - Manual scraping")
-        print(f"   GET  /api/health        - Health check")
-        print("")
-        print("📊 Usage Examples:")
-        print(f"   curl http://{settings.api_host}:{settings.api_port}/api/health")
-        print(f"   curl http://{settings.api_host}:{settings.api_port}/api/jobs?title=python")
-        print("=" * 60)
-        print("✅ Server ready! Open your browser to start browsing jobs.")
-        print("")
+    return app
+
+
+def log_startup_info(settings) -> None:
+    """Log the server address and available endpoints."""
+    logger = get_logger("API")
+    base_url = f"http://{settings.api_host}:{settings.api_port}"
+    logger.info("LokerPuller API server starting")
+    logger.info("Server: %s", base_url)
+    logger.info("Database: %s", settings.db_path)
+    logger.info("Logs: %s", settings.log_path)
+    logger.info("Web interface: %s | API base: %s/api/ | Health check: %s/api/health", base_url, base_url, base_url)
+    logger.info("Endpoints: GET /api/jobs, GET /api/jobs/stats, GET /api/jobs/filters, POST /api/scrape, GET /api/health")
+
+
+def run_app(app: Flask, settings) -> None:
+    """
+    Serve the app until the server stops, then drop queued manual scrapes.
     
-    # Print startup info when app is created
-    print_startup_info()
+    The executor's worker thread is joined at interpreter exit, so without
+    the shutdown every queued scrape would run before the process exits. A
+    scrape that is already running still finishes first.
     
-    return app
+    Args:
+        app: Application returned by create_app
+        settings: Settings providing the host, port and debug flag
+    """
+    try:
+        app.run(
+            host=settings.api_host,
+            port=settings.api_port,
+            debug=settings.api_debug
+        )
+    finally:
+        app.extensions['scrape_executor'].shutdown(wait=False, cancel_futures=True)
 
 
 def main():
     """Main function to run the API server."""
     settings = get_settings()
+    setup_logging(log_file=settings.get_log_file('api'))
+    exit_cleanly_on_sigterm()
     app = create_app()
+    log_startup_info(settings)
     
-    app.run(
-        host=settings.api_host,
-        port=settings.api_port,
-        debug=settings.api_debug
-    )
+    run_app(app, settings)
 
 
 if __name__ == "__main__":
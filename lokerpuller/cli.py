@@ -4,17 +4,16 @@ Command line interface for LokerPuller.
 
 import sys
 import argparse
-from typing import Optional
+import logging
 
-from .core.scraper import JobScraper
-from .core.scheduler import JobScheduler
-from .api.app import create_app
 from .config.settings import get_settings
-from .utils.logging import setup_logging
+from .utils.logging import exit_cleanly_on_sigterm, setup_logging
 
 
 def run_scraper(args) -> int:
     """Run the job scraper."""
+    from .core.scraper import JobScraper
+    
     try:
         scraper = JobScraper()
         result = scraper.scrape_jobs(
@@ -34,6 +33,8 @@ def run_scraper(args) -> int:
 
 def run_scheduler(args) -> int:
     """Run the job scheduler."""
+    from .core.scheduler import JobScheduler
+    
     try:
         scheduler = JobScheduler()
         
@@ -52,15 +53,17 @@ def run_scheduler(args) -> int:
 
 def run_api(args) -> int:
     """Run the API server."""
+    from .api.app import create_app, log_startup_info, run_app
+    
     try:
         settings = get_settings()
         app = create_app()
         
-        app.run(
-            host=settings.api_host,
-            port=settings.api_port,
-            debug=settings.api_debug
-        )
+        # Only announce the server on an interactive terminal
+        if not args.quiet and sys.stderr.isatty():
+            log_startup_info(settings)
+        
+        run_app(app, settings)
         return 0
     except Exception as e:
         print(f"❌ API server failed: {e}")
@@ -86,21 +89,22 @@ def main():
     scraper_parser.add_argument('--job-type', help='Job type filter')
     scraper_parser.add_argument('--hours-old', type=int, help='Maximum job age in hours')
     scraper_parser.add_argument('--verbose', '-v', action='store_true', help='Enable verbose logging')
-    scraper_parser.set_defaults(func=run_scraper)
+    scraper_parser.set_defaults(func=run_scraper, component='scraper')
     
     # Scheduler command
     scheduler_parser = subparsers.add_parser('schedule', help='Run job scheduler')
     scheduler_parser.add_argument('command', choices=['daily', 'weekly', 'cleanup'], 
                                  help='Scheduler command to run')
     scheduler_parser.add_argument('--verbose', '-v', action='store_true', help='Enable verbose logging')
-    scheduler_parser.set_defaults(func=run_scheduler)
+    scheduler_parser.set_defaults(func=run_scheduler, component='scheduler')
     
     # API command
     api_parser = subparsers.add_parser('api', help='Run API server')
     api_parser.add_argument('--host', help='API host address')
     api_parser.add_argument('--port', type=int, help='API port number')
     api_parser.add_argument('--debug', action='store_true', help='Enable debug mode')
-    api_parser.set_defaults(func=run_api)
+    api_parser.add_argument('--quiet', '-q', action='store_true', help='Do not log the startup banner')
+    api_parser.set_defaults(func=run_api, component='api')
     
     # Parse arguments
     args = parser.parse_args()
@@ -109,10 +113,13 @@ def main():
         parser.print_help()
         return 1
     
-    # Setup logging if verbose
-    if hasattr(args, 'verbose') and args.verbose:
-        import logging
-        logging.getLogger().setLevel(logging.DEBUG)
+    # Setup logging; each command appends to its own file under LOG_PATH
+    verbose = getattr(args, 'verbose', False)
+    setup_logging(
+        level=logging.DEBUG if verbose else logging.INFO,
+        log_file=get_settings().get_log_file(args.component)
+    )
+    exit_cleanly_on_sigterm()
     
     # Update settings if provided
     if args.command == 'api':
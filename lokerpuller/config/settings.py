@@ -3,8 +3,8 @@ Settings and configuration management for LokerPuller.
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
 from dataclasses import dataclass
 
 
@@ -29,11 +29,12 @@ class Settings:
     max_results_per_request: int = 200
     scraping_timeout: int = 1800  # 30 minutes
     
+    # Caching settings
+    cache_ttl: int = 60  # Seconds to cache stats/filter aggregates
+    
     # Memory optimization settings
     batch_size: int = 50
     batch_delay: int = 10
-    site_delay: int = 30
-    country_delay: int = 60
     
     # Cleanup settings
     cleanup_days: int = 14
@@ -52,10 +53,9 @@ class Settings:
             default_results_per_site=int(os.getenv("DEFAULT_RESULTS_PER_SITE", "25")),
             max_results_per_request=int(os.getenv("MAX_RESULTS_PER_REQUEST", "200")),
             scraping_timeout=int(os.getenv("SCRAPING_TIMEOUT", "1800")),
+            cache_ttl=int(os.getenv("CACHE_TTL", "60")),
             batch_size=int(os.getenv("BATCH_SIZE", "50")),
             batch_delay=int(os.getenv("BATCH_DELAY", "10")),
-            site_delay=int(os.getenv("SITE_DELAY", "30")),
-            country_delay=int(os.getenv("COUNTRY_DELAY", "60")),
             cleanup_days=int(os.getenv("CLEANUP_DAYS", "14")),
             log_retention_days=int(os.getenv("LOG_RETENTION_DAYS", "7")),
         )
@@ -79,27 +79,20 @@ class Settings:
         return os.path.join(self.log_path, f"{component}.log")
 
 
-# Global settings instance
-_settings: Optional[Settings] = None
-
-
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get the global settings instance."""
-    global _settings
-    if _settings is None:
-        _settings = Settings.from_env()
-        _settings.ensure_directories()
-    return _settings
+    settings = Settings.from_env()
+    settings.ensure_directories()
+    return settings
 
 
 def update_settings(**kwargs) -> None:
-    """Update global settings."""
-    global _settings
-    if _settings is None:
-        _settings = Settings.from_env()
+    """Update global settings in place."""
+    settings = get_settings()
     
     for key, value in kwargs.items():
-        if hasattr(_settings, key):
-            setattr(_settings, key, value)
+        if hasattr(settings, key):
+            setattr(settings, key, value)
     
-    _settings.ensure_directories() 
\ No newline at end of file
+    settings.ensure_directories() 
\ No newline at end of file
@@ -4,20 +4,36 @@ Core job scheduler for LokerPuller.
 Handles automated job scraping with memory optimization for e2-small instances.
 """
 
-import os
 import sys
 import time
 import gc
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+import ctypes
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from typing import List, Dict, Optional, Tuple
 
 from ..database.manager import DatabaseManager
-from ..utils.logging import get_logger, log_system_resources, cleanup_old_logs
+from ..utils.logging import (
+    cleanup_old_logs, exit_cleanly_on_sigterm, get_logger, log_system_resources, setup_logging
+)
 from ..utils.constants import SEA_SCRAPING_CONFIG, MEMORY_OPTIMIZED_CONFIG
 from ..config.settings import get_settings
 from .scraper import JobScraper
 
 
+def _load_malloc_trim():
+    """Return glibc's malloc_trim when available, otherwise None."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        return ctypes.CDLL("libc.so.6").malloc_trim
+    except (OSError, AttributeError):
+        return None
+
+
+_malloc_trim = _load_malloc_trim()
+
+
 class JobScheduler:
     """Main job scheduler class for LokerPuller."""
     
@@ -26,20 +42,22 @@ class JobScheduler:
         self.logger = get_logger("Scheduler")
         self.settings = get_settings()
         self.db_manager = DatabaseManager(self.settings.db_path)
-        self.scraper = JobScraper()
+        self.scraper = JobScraper(self.db_manager)
         
     def cleanup_memory(self) -> None:
-        """Force garbage collection and memory cleanup."""
+        """Force garbage collection and return freed heap memory to the OS."""
         self.logger.debug("🧹 Performing memory cleanup...")
         gc.collect()
-        time.sleep(2)  # Give system time to cleanup
+        if _malloc_trim is not None:
+            _malloc_trim(0)
     
     def run_scraping_job(
         self, 
         country: str, 
         search_term: str, 
         sites: List[str],
-        max_results: int = 25
+        max_results: int = 25,
+        site_workers: Optional[int] = None
     ) -> bool:
         """
         Run a single scraping job with error handling and logging.
@@ -49,22 +67,23 @@ class JobScheduler:
             search_term: Job search term
             sites: List of sites to scrape
             max_results: Maximum results per site
+            site_workers: Sites scraped at once; defaults to max_concurrent_sites
             
         Returns:
             True if successful, False otherwise
         """
         if country not in SEA_SCRAPING_CONFIG:
-            self.logger.error(f"❌ Unknown country: {country}")
+            self.logger.error("❌ Unknown country: %s", country)
             return False
             
         config = SEA_SCRAPING_CONFIG[country]
         location = config['location']
         
-        self.logger.info(f"🌐 Starting scrape: {country}")
-        self.logger.info(f"   🔍 Search: '{search_term}'")
-        self.logger.info(f"   📍 Location: {location}")
-        self.logger.info(f"   🌐 Sites: {', '.join(sites)}")
-        self.logger.info(f"   📊 Max results: {max_results}")
+        self.logger.info("🌐 Starting scrape: %s", country)
+        self.logger.info("   🔍 Search: '%s'", search_term)
+        self.logger.info("   📍 Location: %s", location)
+        self.logger.info("   🌐 Sites: %s", ', '.join(sites))
+        self.logger.info("   📊 Max results: %s", max_results)
         
         start_time = time.time()
         
@@ -75,26 +94,72 @@ class JobScheduler:
                 location=location,
                 results_per_site=max_results,
                 sites=sites,
-                hours_old=336  # Only jobs from last 2 weeks
+                hours_old=336,  # Only jobs from last 2 weeks
+                max_workers=site_workers
             )
             
             elapsed_time = time.time() - start_time
             
             if inserted_count >= 0:  # Success (even if 0 jobs inserted)
-                self.logger.info(f"✅ {country} scrape completed successfully")
-                self.logger.info(f"   ⏱️  Time: {elapsed_time:.1f} seconds")
-                self.logger.info(f"   📈 Jobs inserted: {inserted_count}")
+                self.logger.info("✅ %s scrape completed successfully", country)
+                self.logger.info("   ⏱️  Time: %.1f seconds", elapsed_time)
+                self.logger.info("   📈 Jobs inserted: %s", inserted_count)
                 return True
             else:
-                self.logger.error(f"❌ {country} scrape failed")
-                self.logger.error(f"   ⏱️  Time: {elapsed_time:.1f} seconds")
+                self.logger.error("❌ %s scrape failed", country)
+                self.logger.error("   ⏱️  Time: %.1f seconds", elapsed_time)
                 return False
                 
         except Exception as e:
             elapsed_time = time.time() - start_time
-            self.logger.error(f"❌ {country} scrape failed after {elapsed_time:.1f} seconds: {e}")
+            self.logger.error("❌ %s scrape failed after %.1f seconds: %s", country, elapsed_time, e)
             return False
     
+    def _run_country(self, country: str, config: Dict, site_workers: Optional[int] = None) -> Tuple[int, int]:
+        """
+        Run every search term configured for a country.
+        
+        Args:
+            country: Country name
+            config: Country scraping configuration
+            site_workers: Sites scraped at once for each search term
+            
+        Returns:
+            Tuple of (successful, failed) scraping job counts
+        """
+        self.logger.info("🌍 Processing country: %s", country)
+        
+        search_terms = config['search_terms']
+        n_terms = len(search_terms)
+        successful_jobs = 0
+        failed_jobs = 0
+        
+        for term_idx, search_term in enumerate(search_terms, 1):
+            self.logger.info("🔍 %s search term %d/%d: '%s'", country, term_idx, n_terms, search_term)
+            
+            # Run scraping job
+            success = self.run_scraping_job(
+                country=country,
+                search_term=search_term,
+                sites=config['sites'],
+                max_results=MEMORY_OPTIMIZED_CONFIG['max_results_per_site'],
+                site_workers=site_workers
+            )
+            
+            if success:
+                successful_jobs += 1
+            else:
+                failed_jobs += 1
+            
+            # Memory optimization between search terms
+            if term_idx < n_terms:
+                delay = MEMORY_OPTIMIZED_CONFIG['batch_delay']
+                self.logger.info("⏳ Waiting %ss before next search term...", delay)
+                time.sleep(delay)
+                self.cleanup_memory()
+        
+        return successful_jobs, failed_jobs
+    
     def run_daily_scraping(self) -> Dict[str, int]:
         """
         Run the daily scraping routine optimized for e2-small.
@@ -104,9 +169,9 @@ class JobScheduler:
         """
         self.logger.info("🚀 LokerPuller Daily Scraping Started")
         self.logger.info("=" * 60)
-        self.logger.info(f"⏰ Start time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}")
-        self.logger.info(f"🌏 Target countries: {', '.join(SEA_SCRAPING_CONFIG.keys())}")
-        self.logger.info(f"💾 Memory optimization: Enabled for e2-small")
+        self.logger.info("⏰ Start time: %s", datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC'))
+        self.logger.info("🌏 Target countries: %s", ', '.join(SEA_SCRAPING_CONFIG))
+        self.logger.info("💾 Memory optimization: Enabled for e2-small")
         self.logger.info("=" * 60)
         
         # Log initial system state
@@ -117,61 +182,56 @@ class JobScheduler:
         failed_jobs = 0
         total_jobs = 0
         
-        # Process each country sequentially to minimize memory usage
-        for country_idx, (country, config) in enumerate(SEA_SCRAPING_CONFIG.items(), 1):
-            self.logger.info(f"🌍 Processing country {country_idx}/{len(SEA_SCRAPING_CONFIG)}: {country}")
+        # Overlap a few countries, splitting the site-scrape budget between them so
+        # no more than max_concurrent_sites scrapes are ever in flight
+        countries = list(SEA_SCRAPING_CONFIG.items())
+        n_countries = len(countries)
+        max_sites = MEMORY_OPTIMIZED_CONFIG['max_concurrent_sites']
+        max_workers = min(MEMORY_OPTIMIZED_CONFIG['max_concurrent_countries'], n_countries, max_sites)
+        site_workers = max_sites // max_workers
+        self.logger.info("🧵 Scraping %d countries at once, %d site(s) each", max_workers, site_workers)
+        
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='country') as executor:
+            futures = {
+                executor.submit(self._run_country, country, config, site_workers): country
+                for country, config in countries
+            }
             
-            # Process each search term for the country
-            for term_idx, search_term in enumerate(config['search_terms'], 1):
-                self.logger.info(f"🔍 Search term {term_idx}/{len(config['search_terms'])}: '{search_term}'")
+            for completed_idx, future in enumerate(as_completed(futures), 1):
+                country = futures[future]
+                try:
+                    success, fail = future.result()
+                except Exception as e:
+                    self.logger.error("❌ %s processing failed: %s", country, e)
+                    success, fail = 0, len(SEA_SCRAPING_CONFIG[country]['search_terms'])
                 
-                # Run scraping job
-                success = self.run_scraping_job(
-                    country=country,
-                    search_term=search_term,
-                    sites=config['sites'],
-                    max_results=MEMORY_OPTIMIZED_CONFIG['max_results_per_site']
-                )
+                successful_jobs += success
+                failed_jobs += fail
+                total_jobs += success + fail
                 
-                total_jobs += 1
-                if success:
-                    successful_jobs += 1
-                else:
-                    failed_jobs += 1
-                
-                # Memory optimization between search terms
-                if term_idx < len(config['search_terms']):
-                    delay = MEMORY_OPTIMIZED_CONFIG['batch_delay']
-                    self.logger.info(f"⏳ Waiting {delay}s before next search term...")
-                    time.sleep(delay)
-                    self.cleanup_memory()
-            
-            # Memory optimization between countries
-            if country_idx < len(SEA_SCRAPING_CONFIG):
-                delay = MEMORY_OPTIMIZED_CONFIG['country_delay']
-                self.logger.info(f"⏳ Waiting {delay}s before next country...")
-                time.sleep(delay)
+                self.logger.info("🌍 Finished country %d/%d: %s", completed_idx, n_countries, country)
                 self.cleanup_memory()
                 
                 # Log system resources periodically
                 log_system_resources(self.logger)
         
         total_elapsed = time.time() - total_start_time
+        success_rate = (successful_jobs/total_jobs)*100 if total_jobs > 0 else 0
         
         # Final summary
         self.logger.info("=" * 60)
         self.logger.info("📊 Daily Scraping Summary:")
-        self.logger.info(f"   ⏰ Total time: {total_elapsed/60:.1f} minutes")
-        self.logger.info(f"   ✅ Successful jobs: {successful_jobs}/{total_jobs}")
-        self.logger.info(f"   ❌ Failed jobs: {failed_jobs}/{total_jobs}")
-        self.logger.info(f"   📈 Success rate: {(successful_jobs/total_jobs)*100:.1f}%")
+        self.logger.info("   ⏰ Total time: %.1f minutes", total_elapsed/60)
+        self.logger.info("   ✅ Successful jobs: %d/%d", successful_jobs, total_jobs)
+        self.logger.info("   ❌ Failed jobs: %d/%d", failed_jobs, total_jobs)
+        self.logger.info("   📈 Success rate: %.1f%%", success_rate)
         
         # Get final database stats
         try:
             stats = self.db_manager.get_statistics()
-            self.logger.info(f"   🗄️  Total jobs in database: {stats['total_jobs']}")
+            self.logger.info("   🗄️  Total jobs in database: %s", stats['total_jobs'])
         except Exception as e:
-            self.logger.error(f"❌ Could not get database stats: {e}")
+            self.logger.error("❌ Could not get database stats: %s", e)
         
         # Final system resources
         log_system_resources(self.logger)
@@ -184,7 +244,7 @@ class JobScheduler:
             'successful_jobs': successful_jobs,
             'failed_jobs': failed_jobs,
             'total_time': total_elapsed,
-            'success_rate': (successful_jobs/total_jobs)*100 if total_jobs > 0 else 0
+            'success_rate': success_rate
         }
     
     def run_weekly_maintenance(self) -> None:
@@ -199,11 +259,11 @@ class JobScheduler:
             
             # Clean up old logs
             cleanup_old_logs(self.settings.log_path, self.settings.log_retention_days)
-            self.logger.info(f"🗂️  Cleaned up old log files")
+            self.logger.info("🗂️  Cleaned up old log files")
             
             # Get database statistics
             stats = self.db_manager.get_statistics()
-            self.logger.info(f"📊 Database statistics:")
+            self.logger.info("📊 Database statistics:")
             self.logger.info(f"   Total jobs: {stats['total_jobs']}")
             self.logger.info(f"   Remote jobs: {stats['remote_percentage']:.1f}%")
             
@@ -249,10 +309,13 @@ def main():
     
     args = parser.parse_args()
     
-    # Setup logging level
-    if args.verbose:
-        import logging
-        logging.getLogger().setLevel(logging.DEBUG)
+    # Setup logging, writing to the scheduler's log file under LOG_PATH
+    import logging
+    setup_logging(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        log_file=get_settings().get_log_file('scheduler')
+    )
+    exit_cleanly_on_sigterm()
     
     # Create scheduler and run command
     scheduler = JobScheduler()
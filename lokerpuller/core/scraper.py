@@ -7,9 +7,13 @@ Handles job scraping from multiple sites with enhanced logging and SEA country f
 import sys
 import os
 import time
-import gc
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+import random
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
 
 # Add jobspy to path if needed
 try:
@@ -27,19 +31,68 @@ except ImportError:
 
 from ..database.manager import DatabaseManager
 from ..utils.logging import get_logger, log_system_resources
-from ..utils.validation import validate_sea_country, validate_search_params
-from ..utils.constants import SEA_COUNTRIES, MEMORY_OPTIMIZED_CONFIG
+from ..utils.validation import SEA_LOCATION_RE, sanitize_job_frame, validate_search_params
+from ..utils.constants import MEMORY_OPTIMIZED_CONFIG, SCRAPED_COLUMNS
 from ..config.settings import get_settings
 
 
+# Put on the jobs queue by each site scrape once it has queued all of its jobs
+_SITE_DONE = object()
+
+# jobspy columns with a handful of distinct values, held as pandas categories
+CATEGORY_COLUMNS = ('site', 'currency', 'job_type', 'interval', 'job_level', 'listing_type')
+
+FLOAT_COLUMNS = ('min_amount', 'max_amount', 'company_rating')
+
+
+def optimize_dtypes(jobs_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Shrink a scraped DataFrame in place by downcasting its columns.
+    
+    Float columns only become float32 when that loses no precision, so the
+    amounts written to the database are unchanged.
+    
+    Args:
+        jobs_df: DataFrame as returned by jobspy.scrape_jobs
+        
+    Returns:
+        The same DataFrame, for chaining
+    """
+    for column in FLOAT_COLUMNS:
+        if column in jobs_df:
+            values = pd.to_numeric(jobs_df[column], errors='coerce')
+            downcast = pd.to_numeric(values, downcast='float')
+            if np.array_equal(downcast.to_numpy(dtype='float64'), values.to_numpy(dtype='float64'), equal_nan=True):
+                values = downcast
+            jobs_df[column] = values
+    
+    if 'is_remote' in jobs_df:
+        try:
+            jobs_df['is_remote'] = jobs_df['is_remote'].astype('boolean')
+        except (TypeError, ValueError):
+            pass  # Non-boolean flags are left for sanitize_job_frame to interpret
+    
+    for column in CATEGORY_COLUMNS:
+        if column in jobs_df:
+            jobs_df[column] = jobs_df[column].astype('category')
+    
+    return jobs_df
+
+
 class JobScraper:
     """Main job scraper class for LokerPuller."""
     
-    def __init__(self):
-        """Initialize the job scraper."""
+    def __init__(self, db_manager: Optional[DatabaseManager] = None):
+        """
+        Initialize the job scraper.
+        
+        Args:
+            db_manager: Database manager to store jobs through; callers that
+                already have one share it, otherwise one is opened on settings.db_path
+        """
         self.logger = get_logger("Scraper")
         self.settings = get_settings()
-        self.db_manager = DatabaseManager(self.settings.db_path)
+        self.db_manager = db_manager or DatabaseManager(self.settings.db_path)
         
     def scrape_site_with_logging(
         self, 
@@ -49,7 +102,7 @@ class JobScraper:
         results_wanted: int,
         job_type: Optional[str] = None, 
         hours_old: Optional[int] = None
-    ) -> List[Dict]:
+    ) -> List[tuple]:
         """
         Scrape a single job site with detailed logging.
         
@@ -62,17 +115,17 @@ class JobScraper:
             hours_old: Optional hours filter
             
         Returns:
-            List of job dictionaries
+            List of sanitized job rows, ordered as JOB_COLUMNS
         """
-        self.logger.info(f"🌐 Starting scrape from {site.upper()}")
-        self.logger.info(f"🔍 Search term: '{search_term}'")
-        self.logger.info(f"📍 Location: {location}")
-        self.logger.info(f"📊 Target results: {results_wanted}")
+        self.logger.info("🌐 Starting scrape from %s", site.upper())
+        self.logger.info("🔍 Search term: '%s'", search_term)
+        self.logger.info("📍 Location: %s", location)
+        self.logger.info("📊 Target results: %s", results_wanted)
         
         if job_type:
-            self.logger.info(f"💼 Job type filter: {job_type}")
+            self.logger.info("💼 Job type filter: %s", job_type)
         if hours_old:
-            self.logger.info(f"⏰ Hours old filter: {hours_old}")
+            self.logger.info("⏰ Hours old filter: %s", hours_old)
         
         start_time = time.time()
         
@@ -81,7 +134,7 @@ class JobScraper:
             log_system_resources(self.logger)
             
             # Perform the scraping
-            self.logger.info(f"🚀 Initiating scrape from {site}...")
+            self.logger.info("🚀 Initiating scrape from %s...", site)
             
             jobs_df = scrape_jobs(
                 site_name=[site],
@@ -97,40 +150,35 @@ class JobScraper:
             elapsed_time = time.time() - start_time
             
             if jobs_df is not None and not jobs_df.empty:
-                jobs_list = jobs_df.to_dict('records')
+                total_found = len(jobs_df)
+                
+                # Only persisted columns travel further, keeping the frame small
+                jobs_df = optimize_dtypes(jobs_df[[column for column in SCRAPED_COLUMNS if column in jobs_df.columns]].copy())
                 
-                # Filter for SEA countries only
-                sea_jobs = []
-                for job in jobs_list:
-                    if job.get('location') and validate_sea_country(job['location']):
-                        sea_jobs.append(job)
+                # Filter for SEA countries in one vectorized pass and sanitize the survivors column-wise
+                sea_mask = jobs_df['location'].fillna('').astype(str).str.contains(SEA_LOCATION_RE)
+                sea_df = jobs_df.loc[sea_mask]
+                sea_jobs = sanitize_job_frame(sea_df)
                 
-                self.logger.info(f"✅ {site.upper()} scraping completed in {elapsed_time:.1f}s")
-                self.logger.info(f"📈 Total jobs found: {len(jobs_list)}")
-                self.logger.info(f"🌏 SEA jobs filtered: {len(sea_jobs)}")
+                self.logger.info("✅ %s scraping completed in %.1fs", site.upper(), elapsed_time)
+                self.logger.info("📈 Total jobs found: %s", total_found)
+                self.logger.info("🌏 SEA jobs filtered: %s", len(sea_jobs))
                 
                 if sea_jobs:
                     # Log sample results
-                    sample_size = min(3, len(sea_jobs))
-                    self.logger.info(f"📋 Sample results from {site}:")
-                    for i, job in enumerate(sea_jobs[:sample_size]):
-                        company = job.get('company', 'Unknown Company')
-                        title = job.get('title', 'Unknown Title')
-                        location = job.get('location', 'Unknown Location')
-                        self.logger.info(f"   {i+1}. {title} at {company} ({location})")
-                
-                # Force garbage collection to free memory
-                del jobs_df, jobs_list
-                gc.collect()
+                    self.logger.info("📋 Sample results from %s:", site)
+                    sample = sea_df.head(3).reindex(columns=['title', 'company', 'location'])
+                    for i, (title, company, location) in enumerate(sample.itertuples(index=False, name=None)):
+                        self.logger.info("   %s. %s at %s (%s)", i+1, title, company, location)
                 
                 return sea_jobs
             else:
-                self.logger.warning(f"⚠️  No jobs found on {site} for '{search_term}' in {location}")
+                self.logger.warning("⚠️  No jobs found on %s for '%s' in %s", site, search_term, location)
                 return []
                 
         except Exception as e:
             elapsed_time = time.time() - start_time
-            self.logger.error(f"❌ Error scraping {site} after {elapsed_time:.1f}s: {str(e)}")
+            self.logger.error("❌ Error scraping %s after %.1fs: %s", site, elapsed_time, e)
             return []
     
     def scrape_jobs(
@@ -140,7 +188,8 @@ class JobScraper:
         results_per_site: int = 25,
         sites: Optional[List[str]] = None,
         job_type: Optional[str] = None,
-        hours_old: Optional[int] = None
+        hours_old: Optional[int] = None,
+        max_workers: Optional[int] = None
     ) -> int:
         """
         Scrape jobs from multiple sites and store in database.
@@ -152,6 +201,8 @@ class JobScraper:
             sites: List of sites to scrape
             job_type: Optional job type filter
             hours_old: Optional hours filter
+            max_workers: Sites scraped at once; defaults to max_concurrent_sites,
+                callers running several searches at once pass their share of it
             
         Returns:
             Number of jobs inserted into database
@@ -162,68 +213,122 @@ class JobScraper:
         # Validate parameters
         is_valid, error_msg = validate_search_params(search_term, location, results_per_site)
         if not is_valid:
-            self.logger.error(f"❌ Invalid parameters: {error_msg}")
+            self.logger.error("❌ Invalid parameters: %s", error_msg)
             raise ValueError(error_msg)
         
         self.logger.info("🚀 LokerPuller Job Scraper Starting")
         self.logger.info("=" * 60)
-        self.logger.info(f"🔍 Search Configuration:")
-        self.logger.info(f"   Search Term: '{search_term}'")
-        self.logger.info(f"   Location: {location}")
-        self.logger.info(f"   Results per site: {results_per_site}")
-        self.logger.info(f"   Sites: {', '.join(sites)}")
-        self.logger.info(f"   Job Type: {job_type or 'Any'}")
-        self.logger.info(f"   Hours Old: {hours_old or 'Any'}")
+        self.logger.info("🔍 Search Configuration:")
+        self.logger.info("   Search Term: '%s'", search_term)
+        self.logger.info("   Location: %s", location)
+        self.logger.info("   Results per site: %s", results_per_site)
+        self.logger.info("   Sites: %s", ', '.join(sites))
+        self.logger.info("   Job Type: %s", job_type or 'Any')
+        self.logger.info("   Hours Old: %s", hours_old or 'Any')
         self.logger.info("=" * 60)
         
         total_start_time = time.time()
-        all_jobs = []
         
-        for i, site in enumerate(sites):
-            self.logger.info(f"📍 Processing site {i+1}/{len(sites)}: {site.upper()}")
-            
-            # Scrape from site
-            site_jobs = self.scrape_site_with_logging(
-                site=site,
-                search_term=search_term,
-                location=location,
-                results_wanted=results_per_site,
-                job_type=job_type,
-                hours_old=hours_old
-            )
-            
-            if site_jobs:
-                all_jobs.extend(site_jobs)
-                self.logger.info(f"✅ Added {len(site_jobs)} jobs from {site}")
-            else:
-                self.logger.warning(f"⚠️  No jobs added from {site}")
-            
-            # Memory optimization: delay between sites
-            if i < len(sites) - 1:  # Don't delay after last site
-                delay = MEMORY_OPTIMIZED_CONFIG['site_delay']
-                self.logger.info(f"⏳ Waiting {delay}s before next site...")
-                time.sleep(delay)
+        # Sites push their jobs here while this thread writes them to the database
+        jobs_queue = queue.Queue(maxsize=MEMORY_OPTIMIZED_CONFIG['job_queue_size'])
+        
+        def scrape_site(site: str) -> None:
+            try:
+                # Jitter the start so concurrent scrapes don't hit the sites in lockstep
+                time.sleep(random.uniform(0, MEMORY_OPTIMIZED_CONFIG['site_jitter']))
+                site_jobs = self.scrape_site_with_logging(
+                    site=site,
+                    search_term=search_term,
+                    location=location,
+                    results_wanted=results_per_site,
+                    job_type=job_type,
+                    hours_old=hours_old
+                )
+                
+                if site_jobs:
+                    self.logger.info("✅ Queued %s jobs from %s", len(site_jobs), site)
+                else:
+                    self.logger.warning("⚠️  No jobs added from %s", site)
                 
-                # Force garbage collection
-                gc.collect()
+                for job in site_jobs:
+                    jobs_queue.put(job)
+            finally:
+                jobs_queue.put(_SITE_DONE)
+        
+        # Site scrapes are network-bound and independent, so run them concurrently
+        max_workers = min(max_workers or MEMORY_OPTIMIZED_CONFIG['max_concurrent_sites'], len(sites))
+        self.logger.info("📍 Processing %s sites with %s workers", len(sites), max_workers)
+        
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='site') as executor:
+            futures = [executor.submit(scrape_site, site) for site in sites]
+            scraped_count, inserted_count = self._write_queued_jobs(jobs_queue, len(sites))
+        
+        # Re-raise anything that escaped a site scrape
+        for future in futures:
+            future.result()
         
         total_elapsed = time.time() - total_start_time
         
         self.logger.info("=" * 60)
-        self.logger.info(f"📊 Scraping Summary:")
-        self.logger.info(f"   Total jobs scraped: {len(all_jobs)}")
-        self.logger.info(f"   Total time: {total_elapsed:.1f}s")
-        self.logger.info(f"   Average per site: {total_elapsed/len(sites):.1f}s")
-        
-        # Insert jobs into database
-        if all_jobs:
-            inserted_count = self.db_manager.insert_jobs(all_jobs)
-            self.logger.info(f"💾 Database insertion completed: {inserted_count} new jobs")
+        self.logger.info("📊 Scraping Summary:")
+        self.logger.info("   Total jobs scraped: %s", scraped_count)
+        self.logger.info("   Total time: %.1fs", total_elapsed)
+        self.logger.info("   Average per site: %.1fs", total_elapsed/len(sites))
+        
+        if scraped_count:
+            self.logger.info("💾 Database insertion completed: %s new jobs", inserted_count)
             
             # Log final system resources
             log_system_resources(self.logger)
-            
-            return inserted_count
         else:
             self.logger.warning("⚠️  No jobs to insert into database")
-            return 0 
\ No newline at end of file
+        
+        return inserted_count
+    
+    def _write_queued_jobs(self, jobs_queue: queue.Queue, producers: int) -> Tuple[int, int]:
+        """
+        Drain scraped jobs from a queue into the database in fixed-size batches.
+        
+        Keeps consuming until every producer has put its _SITE_DONE marker, even
+        after a failed insert, so producers blocked on a full queue are released.
+        
+        Args:
+            jobs_queue: Queue the site scrapes put jobs into
+            producers: Number of producers that will signal completion
+            
+        Returns:
+            Tuple of (jobs_scraped, jobs_inserted)
+            
+        Raises:
+            Exception: The first database error, once all producers are done
+        """
+        batch_size = MEMORY_OPTIMIZED_CONFIG['insert_batch_size']
+        batch = []
+        scraped_count = 0
+        inserted_count = 0
+        error = None
+        
+        def flush() -> None:
+            nonlocal inserted_count, error
+            if batch and error is None:
+                try:
+                    inserted_count += self.db_manager.insert_rows(batch)
+                except Exception as e:
+                    error = e
+            batch.clear()
+        
+        while producers:
+            job = jobs_queue.get()
+            if job is _SITE_DONE:
+                producers -= 1
+                continue
+            
+            scraped_count += 1
+            batch.append(job)
+            if len(batch) >= batch_size:
+                flush()
+        flush()
+        
+        if error is not None:
+            raise error
+        return scraped_count, inserted_count 
\ No newline at end of file
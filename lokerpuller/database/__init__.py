@@ -5,6 +5,6 @@ Contains database management, models, and utilities.
 """
 
 from .manager import DatabaseManager
-from .models import Job
+from .models import Job, JobRecord
 
-__all__ = ["DatabaseManager", "Job"] 
\ No newline at end of file
+__all__ = ["DatabaseManager", "Job", "JobRecord"] 
\ No newline at end of file
@@ -2,15 +2,127 @@
 Database manager for LokerPuller.
 """
 
+import atexit
+import itertools
+import json
+import logging
+import os
+import queue
 import sqlite3
-import gc
-from typing import List, Dict, Any, Optional, Tuple
-from datetime import datetime, timedelta
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from functools import partial
+from typing import List, Dict, Any, Callable, Iterator, Optional, Set, Tuple
 
 from ..utils.logging import get_logger
-from ..utils.constants import DEFAULT_DB_SCHEMA, DB_INDEXES
-from ..utils.validation import validate_sea_country, sanitize_job_data
-from .models import Job
+from ..utils.constants import (
+    COMPRESSED_COLUMNS, DEFAULT_DB_INIT_SQL, DB_COLUMN_MIGRATIONS, FTS_MIN_TERM_LENGTH, JOB_COLUMNS,
+    JOB_FTS_SCHEMA, JOB_STATS_REBUILD_SQL, SEA_COUNTRIES, SORT_COLUMNS, SQLITE_PRAGMAS,
+    VALID_SORT_FIELDS
+)
+from ..utils.validation import compute_url_hash, get_sea_country, sanitize_job_row
+
+
+# Prepared once; rows colliding on url_hash (or on the UNIQUE(job_url, site) of
+# tables created before it) are skipped, while other constraint failures still
+# raise instead of being dropped like OR IGNORE does
+INSERT_JOB_SQL = (
+    f"INSERT INTO jobs ({', '.join(JOB_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(JOB_COLUMNS))}) "
+    f"ON CONFLICT DO NOTHING"
+)
+
+
+# Shorter texts are stored as-is; zlib overhead outweighs the savings
+COMPRESS_MIN_LENGTH = 256
+
+_COMPRESSED_INDEXES = tuple(JOB_COLUMNS.index(column) for column in COMPRESSED_COLUMNS)
+
+_URL_HASH_INDEX = JOB_COLUMNS.index('url_hash')
+_TITLE_INDEX = JOB_COLUMNS.index('title')
+_LOCATION_INDEX = JOB_COLUMNS.index('location')
+_COUNTRY_INDEX = JOB_COLUMNS.index('country')
+
+
+def _encode_text(value: Optional[str]) -> Any:
+    """Compress a long text value into a BLOB, leaving short values and None alone."""
+    if value is None or len(value) < COMPRESS_MIN_LENGTH:
+        return value
+    return zlib.compress(value.encode('utf-8'), 6)
+
+
+def _decode_text(value: Any) -> Any:
+    """Inverse of _encode_text; rows written before compression are plain TEXT."""
+    if isinstance(value, bytes):
+        return zlib.decompress(value).decode('utf-8')
+    return value
+
+
+def _decode_rows(columns: Tuple[str, ...], rows: Iterator[tuple]) -> Iterator[tuple]:
+    """Decompress the COMPRESSED_COLUMNS of each row as it is consumed."""
+    indexes = [i for i, column in enumerate(columns) if column in COMPRESSED_COLUMNS]
+    if not indexes:
+        return rows
+    
+    def decode(row: tuple) -> tuple:
+        row = list(row)
+        for i in indexes:
+            row[i] = _decode_text(row[i])
+        return tuple(row)
+    
+    return (decode(row) for row in rows)
+
+
+# Idle connections each manager keeps open for reuse across threads
+CONNECTION_POOL_SIZE = 4
+
+# SQLite allows one writer per file; every manager on the same file queues on one lock
+_write_locks: Dict[str, threading.Lock] = {}
+_write_locks_lock = threading.Lock()
+
+
+def _get_write_lock(db_path: str) -> threading.Lock:
+    """Return the process-wide write lock for a database file."""
+    with _write_locks_lock:
+        return _write_locks.setdefault(os.path.realpath(db_path), threading.Lock())
+
+
+class _PooledRows:
+    """
+    Row iterator holding a pooled connection until it is exhausted, closed or dropped.
+    
+    Lets search methods return rows lazily while still handing their
+    connection back to the pool, e.g. when a streamed response is abandoned.
+    """
+    
+    __slots__ = ('_rows', '_cursor', '_release')
+    
+    def __init__(self, rows: Iterator[tuple], cursor: sqlite3.Cursor, release: Callable[[], None]):
+        self._rows = rows
+        self._cursor = cursor
+        self._release = release
+    
+    def __iter__(self) -> '_PooledRows':
+        return self
+    
+    def __next__(self) -> tuple:
+        try:
+            return next(self._rows)
+        except BaseException:
+            self.close()
+            raise
+    
+    def close(self) -> None:
+        """Finish the statement and return the connection to the pool."""
+        release, self._release = self._release, None
+        if release is not None:
+            self._cursor.close()
+            release()
+    
+    def __del__(self):
+        self.close()
 
 
 class DatabaseManager:
@@ -25,26 +137,190 @@ class DatabaseManager:
         """
         self.db_path = db_path
         self.logger = get_logger("DatabaseManager")
+        self._cache: Dict[str, Tuple[float, Any]] = {}
+        self._cache_lock = threading.Lock()
+        self._cache_generation = 0  # Bumped by invalidate_caches
+        self._pool: queue.LifoQueue = queue.LifoQueue(maxsize=CONNECTION_POOL_SIZE)
+        self._connections: Set[sqlite3.Connection] = set()  # Every open connection, pooled or checked out
+        self._connections_lock = threading.Lock()
+        self._write_lock = _get_write_lock(db_path)  # Shared with other managers on this file
+        self._fts_enabled = False  # Set by _ensure_database once jobs_fts is available
+        self._job_json_sql = None  # json_object() over every column, set by _ensure_database
+        atexit.register(self.close)
         self._ensure_database()
     
-    def _ensure_database(self) -> None:
-        """Ensure database and tables exist."""
-        self.logger.info(f"🗄️  Creating/verifying database at: {self.db_path}")
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open a connection with the PRAGMAs and functions every query relies on."""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        for pragma in SQLITE_PRAGMAS:
+            conn.execute(pragma)
+        conn.create_function('decode_text', 1, _decode_text, deterministic=True)
+        
+        with self._connections_lock:
+            self._connections.add(conn)
+        return conn
+    
+    def _acquire_connection(self) -> sqlite3.Connection:
+        """
+        Check a connection out of the pool, opening a new one if none is idle.
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        Connections are shared by every thread, so the API's per-request
+        threads reuse the page cache and PRAGMA setup of earlier requests
+        instead of opening a connection each. Checking out never blocks:
+        nested calls on one thread, or more busy threads than the pool holds,
+        simply open extra connections. With WAL enabled, a writer does not
+        block readers on the other connections.
         
-        # Create main table
-        cursor.execute(DEFAULT_DB_SCHEMA)
+        Returns:
+            SQLite connection owned by the caller until it is released
+        """
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            return self._open_connection()
+    
+    def _release_connection(self, conn: sqlite3.Connection) -> None:
+        """
+        Return a checked-out connection to the pool.
         
-        # Create indexes
-        for index_sql in DB_INDEXES:
-            cursor.execute(index_sql)
+        Connections beyond CONNECTION_POOL_SIZE idle ones, or released after
+        close(), are closed instead.
         
-        conn.commit()
+        Args:
+            conn: Connection obtained from _acquire_connection
+        """
+        if conn.in_transaction:
+            conn.rollback()
+        with self._connections_lock:
+            if conn in self._connections:
+                try:
+                    self._pool.put_nowait(conn)
+                    return
+                except queue.Full:
+                    self._connections.discard(conn)
         conn.close()
+    
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Check a pooled connection out for the duration of a with block."""
+        conn = self._acquire_connection()
+        try:
+            yield conn
+        finally:
+            self._release_connection(conn)
+    
+    def close(self) -> None:
+        """Close every connection opened by this manager."""
+        with self._connections_lock:
+            connections = list(self._connections)
+            self._connections.clear()
+            while not self._pool.empty():
+                self._pool.get_nowait()
+        for conn in connections:
+            conn.close()
+    
+    def get_cached(self, key: str, loader: Callable[[], Any], ttl: float = 60) -> Any:
+        """
+        Return a cached query result, reloading it once it is older than ttl.
+        
+        Writes made through this manager drop the cache as they commit, so ttl
+        only bounds how long writes from other processes go unseen.
+        
+        Args:
+            key: Cache key
+            loader: Callable producing the value on a miss
+            ttl: Time to live in seconds
+            
+        Returns:
+            Cached or freshly loaded value
+        """
+        now = time.monotonic()
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is not None and now - entry[0] < ttl:
+                return entry[1]
+            generation = self._cache_generation
+        
+        value = loader()
+        with self._cache_lock:
+            # A write committed while loading; the value may predate it, so don't keep it
+            if generation == self._cache_generation:
+                self._cache[key] = (now, value)
+        return value
+    
+    def invalidate_caches(self) -> None:
+        """Drop all cached query results; every write path calls this once it commits."""
+        with self._cache_lock:
+            self._cache.clear()
+            self._cache_generation += 1
+    
+    def _ensure_database(self) -> None:
+        """Ensure database and tables exist."""
+        self.logger.info(f"🗄️  Creating/verifying database at: {self.db_path}")
+        
+        with self._connection() as conn:
+            conn.create_function('sea_country', 1, get_sea_country, deterministic=True)
+            conn.create_function('url_hash', 2, compute_url_hash, deterministic=True)
+            cursor = conn.cursor()
+            
+            # Add columns missing from databases created by older versions; a new
+            # table is created complete by the init script below
+            existing_columns = {row[1] for row in cursor.execute("PRAGMA table_xinfo(jobs)")}
+            for column, definition, backfill_sql in DB_COLUMN_MIGRATIONS:
+                if existing_columns and column not in existing_columns:
+                    self.logger.info(f"🔧 Adding column {column} to jobs table")
+                    cursor.execute(f"ALTER TABLE jobs ADD COLUMN {column} {definition}")
+                    if backfill_sql:
+                        cursor.execute(backfill_sql)
+            
+            # Create the main table, the statistics summary table with the triggers
+            # maintaining it, and the indexes in one script
+            cursor.executescript(DEFAULT_DB_INIT_SQL)
+            
+            # Create the full-text index used by text filters, if this SQLite has FTS5
+            self._fts_enabled = self._ensure_fts(cursor)
+            
+            conn.commit()
+            
+            # Select expression building each row's JSON object inside SQLite, keys in SELECT * order
+            pairs = []
+            for _, name, _, _, _, _, hidden in cursor.execute("PRAGMA table_xinfo(jobs)"):
+                if hidden != 1:
+                    pairs.append(f"'{name}', " + (f"decode_text({name})" if name in COMPRESSED_COLUMNS else name))
+            self._job_json_sql = f"json_object({', '.join(pairs)})"
+            
+            # Seed the counters once for tables that existed before job_stats
+            if cursor.execute("SELECT 1 FROM job_stats WHERE key = 'total'").fetchone() is None:
+                self.logger.info("🔧 Building job statistics summary")
+                cursor.executescript(JOB_STATS_REBUILD_SQL)
         self.logger.info("✅ Database schema created/verified successfully")
     
+    def _ensure_fts(self, cursor: sqlite3.Cursor) -> bool:
+        """
+        Create jobs_fts and its sync triggers, indexing existing rows on first creation.
+        
+        Args:
+            cursor: Cursor on the schema-setup connection
+            
+        Returns:
+            True if full-text search is available, False to keep using LIKE
+        """
+        existed = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'jobs_fts'"
+        ).fetchone() is not None
+        
+        try:
+            for fts_sql in JOB_FTS_SCHEMA:
+                cursor.execute(fts_sql)
+        except sqlite3.OperationalError as e:
+            self.logger.warning(f"⚠️  Full-text search unavailable, text filters will use LIKE: {e}")
+            return False
+        
+        if not existed:
+            self.logger.info("🔧 Building full-text search index")
+            cursor.execute("INSERT INTO jobs_fts (jobs_fts) VALUES ('rebuild')")
+        return True
+    
     def insert_jobs(self, jobs_data: List[Dict[str, Any]]) -> int:
         """
         Insert job postings into the database.
@@ -59,119 +335,146 @@ class DatabaseManager:
             self.logger.warning("⚠️  No jobs data to insert")
             return 0
         
-        self.logger.info(f"💾 Inserting {len(jobs_data)} jobs into database...")
-        
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        self.logger.info("💾 Inserting %s jobs into database...", len(jobs_data))
         
-        inserted_count = 0
+        # Rows are sanitized one by one, so short API batches never load pandas.
+        # Sanitizing already mapped each location to a SEA country; skip the rest
+        rows = []
         skipped_count = 0
+        log_skipped = self.logger.isEnabledFor(logging.DEBUG)
+        for row in map(sanitize_job_row, jobs_data):
+            if row[_LOCATION_INDEX] and row[_COUNTRY_INDEX] is None:
+                if log_skipped:
+                    self.logger.debug("🚫 Skipping job outside SEA: %s at %s", row[_TITLE_INDEX], row[_LOCATION_INDEX])
+                skipped_count += 1
+            else:
+                rows.append(row)
+        
+        inserted_count = self._write_rows(rows)
+        self._log_insert_summary(len(jobs_data), inserted_count, skipped_count)
+        return inserted_count
+    
+    def insert_rows(self, rows: List[tuple]) -> int:
+        """
+        Insert already sanitized job rows into the database.
         
-        # Process jobs in batches to save memory
-        batch_size = 50
-        for i in range(0, len(jobs_data), batch_size):
-            batch = jobs_data[i:i + batch_size]
-            self.logger.debug(f"📦 Processing batch {i//batch_size + 1}/{(len(jobs_data) + batch_size - 1)//batch_size}")
+        Args:
+            rows: Tuples ordered as JOB_COLUMNS, e.g. JobRecord or from sanitize_job_frame
             
-            for job_data in batch:
-                try:
-                    # Validate Southeast Asian location
-                    if job_data.get('location') and not validate_sea_country(job_data['location']):
-                        self.logger.debug(f"🚫 Skipping job outside SEA: {job_data.get('title', 'Unknown')} at {job_data.get('location', 'Unknown')}")
-                        skipped_count += 1
-                        continue
-                    
-                    # Sanitize job data
-                    sanitized_job = sanitize_job_data(job_data)
-                    
-                    # Insert job
-                    cursor.execute('''
-                        INSERT OR IGNORE INTO jobs (
-                            site, job_url, job_url_direct, title, company_name, location,
-                            job_type, date_posted, interval, min_amount, max_amount, currency,
-                            is_remote, job_level, job_function, company_industry, listing_type,
-                            emails, description, company_url, company_url_direct, company_addresses,
-                            company_num_employees, company_revenue, company_description,
-                            logo_photo_url, banner_photo_url, ceo_name, ceo_photo_url,
-                            compensation_interval, salary_source, company_rating, skills, experience_range
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', (
-                        sanitized_job['site'], sanitized_job['job_url'], sanitized_job['job_url_direct'],
-                        sanitized_job['title'], sanitized_job['company_name'], sanitized_job['location'],
-                        sanitized_job['job_type'], sanitized_job['date_posted'], sanitized_job['interval'],
-                        sanitized_job['min_amount'], sanitized_job['max_amount'], sanitized_job['currency'],
-                        sanitized_job['is_remote'], sanitized_job['job_level'], sanitized_job['job_function'],
-                        sanitized_job['company_industry'], sanitized_job['listing_type'], sanitized_job['emails'],
-                        sanitized_job['description'], sanitized_job['company_url'], sanitized_job['company_url_direct'],
-                        sanitized_job['company_addresses'], sanitized_job['company_num_employees'],
-                        sanitized_job['company_revenue'], sanitized_job['company_description'],
-                        sanitized_job['logo_photo_url'], sanitized_job['banner_photo_url'],
-                        sanitized_job['ceo_name'], sanitized_job['ceo_photo_url'],
-                        sanitized_job['compensation_interval'], sanitized_job['salary_source'],
-                        sanitized_job['company_rating'], sanitized_job['skills'], sanitized_job['experience_range']
-                    ))
-                    
-                    if cursor.rowcount > 0:
-                        inserted_count += 1
-                        self.logger.debug(f"✅ Inserted: {sanitized_job.get('title', 'Unknown')} at {sanitized_job.get('company_name', 'Unknown')}")
-                    else:
-                        self.logger.debug(f"⏭️  Duplicate skipped: {sanitized_job.get('title', 'Unknown')} at {sanitized_job.get('company_name', 'Unknown')}")
-                        
-                except Exception as e:
-                    self.logger.error(f"❌ Error inserting job {job_data.get('title', 'Unknown')}: {e}")
-                    continue
-            
-            # Commit batch and free memory
-            conn.commit()
-            gc.collect()
-        
-        conn.close()
+        Returns:
+            Number of jobs inserted
+        """
+        if not rows:
+            self.logger.warning("⚠️  No jobs data to insert")
+            return 0
         
-        self.logger.info(f"✅ Database insertion complete:")
-        self.logger.info(f"   📈 New jobs inserted: {inserted_count}")
-        self.logger.info(f"   🚫 Jobs outside SEA skipped: {skipped_count}")
-        self.logger.info(f"   ⏭️  Duplicates skipped: {len(jobs_data) - inserted_count - skipped_count}")
+        self.logger.info("💾 Inserting %s jobs into database...", len(rows))
         
+        inserted_count = self._write_rows(rows)
+        self._log_insert_summary(len(rows), inserted_count)
         return inserted_count
     
-    def search_jobs(self, filters: Dict[str, Any] = None, page: int = 1, per_page: int = 20) -> Tuple[List[Dict], int]:
+    def _write_rows(self, rows: List[tuple]) -> int:
         """
-        Search jobs with filters and pagination.
+        Write job rows in one transaction, skipping postings already stored.
         
         Args:
-            filters: Search filters
-            page: Page number (1-based)
-            per_page: Results per page
+            rows: Tuples ordered as JOB_COLUMNS
             
         Returns:
-            Tuple of (jobs_list, total_count)
+            Number of rows inserted
+        """
+        # Keep the first copy of postings repeated within the batch
+        rows_by_hash = {}
+        for row in rows:
+            rows_by_hash.setdefault(row[_URL_HASH_INDEX], row)
+        
+        with self._connection() as conn:
+            # Drop postings already stored with one probe of the url_hash index
+            if rows_by_hash:
+                existing = conn.execute(
+                    "SELECT url_hash FROM jobs WHERE url_hash IN (SELECT value FROM json_each(?))",
+                    (json.dumps(list(rows_by_hash)),)
+                )
+                for (url_hash,) in existing:
+                    del rows_by_hash[url_hash]
+            rows = []
+            for row in rows_by_hash.values():
+                # Compress only rows that will actually be written
+                row = list(row)
+                for i in _COMPRESSED_INDEXES:
+                    row[i] = _encode_text(row[i])
+                rows.append(tuple(row))
+            
+            # One prepared statement and one transaction for the whole batch. executemany's
+            # rowcount sums the changes of every row, so it counts exactly the rows inserted
+            # (a RETURNING clause would be no better: executemany discards its result rows)
+            try:
+                with self._write_lock, conn:
+                    cursor = conn.executemany(INSERT_JOB_SQL, rows)
+                    inserted_count = cursor.rowcount if rows else 0
+            except sqlite3.Error as e:
+                self.logger.error("❌ Error inserting %s jobs: %s", len(rows), e)
+                raise
+        
+        if inserted_count:
+            self.invalidate_caches()
+        return inserted_count
+    
+    def _log_insert_summary(self, total_count: int, inserted_count: int, skipped_count: int = 0) -> None:
+        """Log how a batch of jobs was split between inserted and skipped."""
+        self.logger.info("✅ Database insertion complete:")
+        self.logger.info("   📈 New jobs inserted: %s", inserted_count)
+        self.logger.info("   🚫 Jobs outside SEA skipped: %s", skipped_count)
+        self.logger.info("   ⏭️  Duplicates skipped: %s", total_count - skipped_count - inserted_count)
+    
+    def _build_search_clauses(self, filters: Dict[str, Any]) -> Tuple[str, List[Any], str]:
         """
-        if filters is None:
-            filters = {}
+        Build the WHERE and ORDER BY clauses for a job search.
         
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # Enable column access by name
-        cursor = conn.cursor()
+        Every filter is a parameterized predicate on an indexed column where one
+        exists, and the ORDER BY always ends with the id tiebreaker so it can be
+        served directly by the (column, scraped_at) indexes.
         
-        # Build WHERE clause
+        Args:
+            filters: Search filters
+            
+        Returns:
+            Tuple of (where_clause, params, order_clause)
+        """
         where_conditions = []
         params = []
         
+        # Substring filters on text columns, as (column, term) pairs
+        text_filters = []
         if filters.get('title'):
-            where_conditions.append("title LIKE ?")
-            params.append(f"%{filters['title']}%")
-        
+            text_filters.append(('title', filters['title']))
         if filters.get('company'):
-            where_conditions.append("company_name LIKE ?")
-            params.append(f"%{filters['company']}%")
-        
+            text_filters.append(('company_name', filters['company']))
         if filters.get('location'):
-            where_conditions.append("location LIKE ?")
-            params.append(f"%{filters['location']}%")
+            text_filters.append(('location', filters['location']))
         
         if filters.get('country'):
-            where_conditions.append("location LIKE ?")
-            params.append(f"%{filters['country']}%")
+            country = filters['country'].strip().title()
+            if country in SEA_COUNTRIES:
+                where_conditions.append("country = ?")
+                params.append(country)
+            else:
+                # Values outside SEA_COUNTRIES (e.g. 'Remote') still match on location text
+                text_filters.append(('location', filters['country']))
+        
+        # Terms the trigram index can serve become one MATCH; the rest stay LIKE scans
+        fts_terms = []
+        for column, term in text_filters:
+            if self._fts_enabled and len(term) >= FTS_MIN_TERM_LENGTH:
+                fts_terms.append(f'{column}:"{term.replace(chr(34), chr(34) * 2)}"')
+            else:
+                where_conditions.append(f"{column} LIKE ?")
+                params.append(f"%{term}%")
+        
+        if fts_terms:
+            where_conditions.append("id IN (SELECT rowid FROM jobs_fts WHERE jobs_fts MATCH ?)")
+            params.append(" AND ".join(fts_terms))
         
         if filters.get('job_type'):
             where_conditions.append("job_type = ?")
@@ -194,9 +497,9 @@ class DatabaseManager:
             params.extend([float(filters['max_salary']), float(filters['max_salary'])])
         
         if filters.get('days_old'):
-            cutoff_date = datetime.now() - timedelta(days=int(filters['days_old']))
-            where_conditions.append("scraped_at >= ?")
-            params.append(cutoff_date.strftime('%Y-%m-%d %H:%M:%S'))
+            # scraped_at is stored in UTC by CURRENT_TIMESTAMP, so compare against SQLite's clock
+            where_conditions.append("scraped_at >= datetime('now', ?)")
+            params.append(f"-{int(filters['days_old'])} days")
         
         where_clause = " AND ".join(where_conditions) if where_conditions else "1=1"
         
@@ -205,109 +508,259 @@ class DatabaseManager:
         sort_order = filters.get('sort_order', 'desc').upper()
         
         # Validate sort fields
-        valid_sort_fields = ['title', 'company_name', 'location', 'min_amount', 'max_amount', 'date_posted', 'scraped_at']
-        if sort_by not in valid_sort_fields:
+        if sort_by not in VALID_SORT_FIELDS:
             sort_by = 'scraped_at'
         
         if sort_order not in ['ASC', 'DESC']:
             sort_order = 'DESC'
         
-        order_clause = f"ORDER BY {sort_by} {sort_order}"
+        order_clause = f"ORDER BY {SORT_COLUMNS.get(sort_by, sort_by)} {sort_order}, id {sort_order}"
+        
+        return where_clause, params, order_clause
+    
+    def count_jobs(self, filters: Dict[str, Any] = None) -> int:
+        """
+        Count jobs matching the search filters.
         
-        # Get total count
-        count_query = f"SELECT COUNT(*) FROM jobs WHERE {where_clause}"
-        cursor.execute(count_query, params)
-        total_count = cursor.fetchone()[0]
+        Args:
+            filters: Search filters
+            
+        Returns:
+            Number of matching jobs
+        """
+        where_clause, params, _ = self._build_search_clauses(filters or {})
         
-        # Get paginated results
-        offset = (page - 1) * per_page
-        query = f"""
-            SELECT * FROM jobs 
-            WHERE {where_clause} 
-            {order_clause}
-            LIMIT ? OFFSET ?
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"SELECT COUNT(*) FROM jobs WHERE {where_clause}", params)
+            return cursor.fetchone()[0]
+    
+    def _select_list(self, as_json: bool) -> str:
+        """Columns selected by a job search, see iter_search_rows."""
+        return f"{self._job_json_sql} AS job_json, scraped_at, id" if as_json else "*"
+    
+    def iter_search_rows(
+        self,
+        filters: Dict[str, Any] = None,
+        page: int = 1,
+        per_page: int = 20,
+        after: Optional[Tuple[str, int]] = None,
+        as_json: bool = False
+    ) -> Tuple[Tuple[str, ...], Iterator[tuple]]:
         """
-        cursor.execute(query, params + [per_page, offset])
+        Run a job search and iterate over the matching rows lazily as plain tuples.
         
-        jobs = []
-        for row in cursor.fetchall():
-            job_dict = dict(row)
-            jobs.append(job_dict)
+        The query is executed immediately, so SQL errors surface to the caller,
+        but rows are only fetched from SQLite as the iterator is consumed.
         
-        conn.close()
+        Args:
+            filters: Search filters
+            page: Page number (1-based), ignored when after is given
+            per_page: Maximum number of rows to return
+            after: Optional (scraped_at, id) keyset position; rows strictly after
+                it in newest-first order are returned instead of an OFFSET page
+            as_json: Return (job_json, scraped_at, id) rows, with each job
+                already serialized to a JSON object by SQLite
+            
+        Returns:
+            Tuple of (column_names, row_iterator)
+        """
+        filters = filters or {}
+        
+        if after is not None:
+            filters = dict(filters, sort_by='scraped_at', sort_order='desc')
+        where_clause, params, order_clause = self._build_search_clauses(filters)
+        
+        if after is not None:
+            where_clause += " AND (scraped_at, id) < (?, ?)"
+            params = params + list(after)
+            limit_clause = "LIMIT ?"
+            params.append(per_page)
+        else:
+            limit_clause = "LIMIT ? OFFSET ?"
+            params = params + [per_page, (page - 1) * per_page]
+        
+        conn = self._acquire_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT {self._select_list(as_json)} FROM jobs 
+                WHERE {where_clause} 
+                {order_clause}
+                {limit_clause}
+            """, params)
+        except BaseException:
+            self._release_connection(conn)
+            raise
+        
+        columns = tuple(column[0] for column in cursor.description)
+        return columns, _PooledRows(_decode_rows(columns, cursor), cursor, partial(self._release_connection, conn))
+    
+    def search_rows_with_total(
+        self,
+        filters: Dict[str, Any] = None,
+        page: int = 1,
+        per_page: int = 20,
+        as_json: bool = False
+    ) -> Tuple[Tuple[str, ...], Iterator[tuple], int]:
+        """
+        Run an OFFSET-paginated job search that also reports the total match count.
+        
+        The total comes from COUNT(*) OVER () on the same query, so the WHERE
+        clause is evaluated once instead of again in a separate COUNT(*).
+        
+        Args:
+            filters: Search filters
+            page: Page number (1-based)
+            per_page: Maximum number of rows to return
+            as_json: Return (job_json, scraped_at, id) rows, see iter_search_rows
+            
+        Returns:
+            Tuple of (column_names, row_iterator, total_count)
+        """
+        where_clause, params, order_clause = self._build_search_clauses(filters or {})
+        
+        conn = self._acquire_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT {self._select_list(as_json)}, COUNT(*) OVER () AS total_count FROM jobs 
+                WHERE {where_clause} 
+                {order_clause}
+                LIMIT ? OFFSET ?
+            """, params + [per_page, (page - 1) * per_page])
+            
+            columns = tuple(column[0] for column in cursor.description[:-1])
+            first_row = cursor.fetchone()
+        except BaseException:
+            self._release_connection(conn)
+            raise
+        
+        if first_row is None:
+            self._release_connection(conn)
+            # Past the last page the window has no row to report on; count separately
+            total_count = self.count_jobs(filters) if page > 1 else 0
+            return columns, iter(()), total_count
+        
+        total_count = first_row[-1]
+        rows = (row[:-1] for row in itertools.chain((first_row,), cursor))
+        return columns, _PooledRows(_decode_rows(columns, rows), cursor, partial(self._release_connection, conn)), total_count
+    
+    def iter_search_jobs(
+        self,
+        filters: Dict[str, Any] = None,
+        page: int = 1,
+        per_page: int = 20,
+        after: Optional[Tuple[str, int]] = None
+    ) -> Iterator[Dict]:
+        """
+        Run a job search and iterate over the matching rows lazily as dictionaries.
+        
+        Args:
+            filters: Search filters
+            page: Page number (1-based), ignored when after is given
+            per_page: Maximum number of rows to return
+            after: Optional (scraped_at, id) keyset position, see iter_search_rows
+            
+        Returns:
+            Iterator of job dictionaries
+        """
+        columns, rows = self.iter_search_rows(filters, page, per_page, after)
+        return (dict(zip(columns, row)) for row in rows)
+    
+    def search_jobs(self, filters: Dict[str, Any] = None, page: int = 1, per_page: int = 20) -> Tuple[List[Dict], int]:
+        """
+        Search jobs with filters and pagination.
+        
+        Args:
+            filters: Search filters
+            page: Page number (1-based)
+            per_page: Results per page
+            
+        Returns:
+            Tuple of (jobs_list, total_count)
+        """
+        columns, rows, total_count = self.search_rows_with_total(filters, page, per_page)
+        jobs = [dict(zip(columns, row)) for row in rows]
         return jobs, total_count
     
+    def search_jobs_seek(
+        self,
+        filters: Dict[str, Any],
+        scraped_at: str,
+        last_id: int,
+        limit: int = 20
+    ) -> List[Dict]:
+        """
+        Search jobs with keyset pagination on (scraped_at, id).
+        
+        Instead of skipping OFFSET rows, the query seeks straight past the last
+        row of the previous page, so deep pages cost the same as the first one.
+        Results are always ordered newest first.
+        
+        Args:
+            filters: Search filters (sort options are ignored)
+            scraped_at: scraped_at of the last row already returned
+            last_id: id of the last row already returned
+            limit: Maximum number of rows to return
+            
+        Returns:
+            List of job dictionaries
+        """
+        return list(self.iter_search_jobs(filters, per_page=limit, after=(scraped_at, last_id)))
+    
     def get_statistics(self) -> Dict[str, Any]:
         """Get database statistics."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        stats = {}
-        
-        # Total jobs
-        cursor.execute("SELECT COUNT(*) FROM jobs")
-        stats['total_jobs'] = cursor.fetchone()[0]
-        
-        # Jobs by country
-        cursor.execute("""
-            SELECT 
-                CASE 
-                    WHEN location LIKE '%Singapore%' THEN 'Singapore'
-                    WHEN location LIKE '%Indonesia%' OR location LIKE '%Jakarta%' THEN 'Indonesia'
-                    WHEN location LIKE '%Malaysia%' OR location LIKE '%Kuala Lumpur%' THEN 'Malaysia'
-                    WHEN location LIKE '%Thailand%' OR location LIKE '%Bangkok%' THEN 'Thailand'
-                    WHEN location LIKE '%Vietnam%' OR location LIKE '%Ho Chi Minh%' OR location LIKE '%Hanoi%' THEN 'Vietnam'
-                    ELSE 'Other'
-                END as country,
-                COUNT(*) as count
-            FROM jobs 
-            GROUP BY country 
-            ORDER BY count DESC
-        """)
-        stats['jobs_by_country'] = [{'country': row[0], 'count': row[1]} for row in cursor.fetchall()]
-        
-        # Jobs by site
-        cursor.execute("SELECT site, COUNT(*) FROM jobs GROUP BY site ORDER BY COUNT(*) DESC")
-        stats['jobs_by_site'] = [{'site': row[0], 'count': row[1]} for row in cursor.fetchall()]
-        
-        # Remote jobs percentage
-        cursor.execute("SELECT COUNT(*) FROM jobs WHERE is_remote = 1")
-        remote_count = cursor.fetchone()[0]
-        stats['remote_percentage'] = (remote_count / stats['total_jobs'] * 100) if stats['total_jobs'] > 0 else 0
-        
-        # Salary statistics
-        cursor.execute("""
-            SELECT 
-                AVG(min_amount) as avg_min,
-                AVG(max_amount) as avg_max,
-                MIN(min_amount) as min_salary,
-                MAX(max_amount) as max_salary,
-                COUNT(*) as jobs_with_salary
-            FROM jobs 
-            WHERE min_amount IS NOT NULL OR max_amount IS NOT NULL
-        """)
-        salary_row = cursor.fetchone()
-        if salary_row and salary_row[4] > 0:
-            stats['salary_stats'] = {
-                'avg_min_salary': round(salary_row[0] or 0, 2),
-                'avg_max_salary': round(salary_row[1] or 0, 2),
-                'min_salary': salary_row[2],
-                'max_salary': salary_row[3],
-                'jobs_with_salary': salary_row[4],
-                'percentage_with_salary': round(salary_row[4] / stats['total_jobs'] * 100, 1) if stats['total_jobs'] > 0 else 0
-            }
-        else:
-            stats['salary_stats'] = {
-                'avg_min_salary': 0,
-                'avg_max_salary': 0,
-                'min_salary': 0,
-                'max_salary': 0,
-                'jobs_with_salary': 0,
-                'percentage_with_salary': 0
-            }
-        
-        conn.close()
-        return stats
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            
+            # Counters are maintained by triggers on jobs, so this reads a handful of rows
+            counters = dict(cursor.execute("SELECT key, value FROM job_stats WHERE value != 0"))
+            total_jobs = int(counters.get('total', 0))
+            
+            stats = {'total_jobs': total_jobs}
+            
+            # Jobs by country and by site, largest first
+            stats['jobs_by_country'] = []
+            stats['jobs_by_site'] = []
+            for key, value in sorted(counters.items(), key=lambda item: item[1], reverse=True):
+                kind, _, name = key.partition(':')
+                if kind == 'country':
+                    stats['jobs_by_country'].append({'country': name, 'count': int(value)})
+                elif kind == 'site':
+                    stats['jobs_by_site'].append({'site': name, 'count': int(value)})
+            
+            # Remote jobs percentage
+            remote_count = int(counters.get('remote', 0))
+            stats['remote_percentage'] = (remote_count / total_jobs * 100) if total_jobs > 0 else 0
+            
+            # Salary statistics
+            jobs_with_salary = int(counters.get('salary_jobs', 0))
+            if jobs_with_salary > 0:
+                # Both extremes are single index lookups on idx_min_amount / idx_max_amount
+                min_salary = cursor.execute("SELECT MIN(min_amount) FROM jobs").fetchone()[0]
+                max_salary = cursor.execute("SELECT MAX(max_amount) FROM jobs").fetchone()[0]
+                min_count = counters.get('min_amount_count', 0)
+                max_count = counters.get('max_amount_count', 0)
+                stats['salary_stats'] = {
+                    'avg_min_salary': round(counters.get('min_amount_sum', 0) / min_count, 2) if min_count else 0,
+                    'avg_max_salary': round(counters.get('max_amount_sum', 0) / max_count, 2) if max_count else 0,
+                    'min_salary': min_salary,
+                    'max_salary': max_salary,
+                    'jobs_with_salary': jobs_with_salary,
+                    'percentage_with_salary': round(jobs_with_salary / total_jobs * 100, 1) if total_jobs > 0 else 0
+                }
+            else:
+                stats['salary_stats'] = {
+                    'avg_min_salary': 0,
+                    'avg_max_salary': 0,
+                    'min_salary': 0,
+                    'max_salary': 0,
+                    'jobs_with_salary': 0,
+                    'percentage_with_salary': 0
+                }
+            
+            return stats
     
     def cleanup_old_jobs(self, days: int = 14) -> int:
         """
@@ -319,44 +772,43 @@ class DatabaseManager:
         Returns:
             Number of jobs deleted
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cutoff_date = datetime.now() - timedelta(days=days)
-        cursor.execute(
-            "DELETE FROM jobs WHERE scraped_at < ?",
-            (cutoff_date.strftime('%Y-%m-%d %H:%M:%S'),)
-        )
-        
-        deleted_count = cursor.rowcount
-        conn.commit()
-        conn.close()
-        
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            
+            # scraped_at is UTC (CURRENT_TIMESTAMP), so the cutoff comes from SQLite's clock too
+            with self._write_lock, conn:
+                cursor.execute(
+                    "DELETE FROM jobs WHERE scraped_at < datetime('now', ?)",
+                    (f"-{int(days)} days",)
+                )
+                deleted_count = cursor.rowcount
+        
+        if deleted_count:
+            self.invalidate_caches()
         self.logger.info(f"🧹 Cleaned up {deleted_count} old jobs (older than {days} days)")
         return deleted_count
     
     def get_filter_options(self) -> Dict[str, List[str]]:
         """Get available filter options."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        options = {}
-        
-        # Get unique companies
-        cursor.execute("SELECT DISTINCT company_name FROM jobs WHERE company_name IS NOT NULL ORDER BY company_name LIMIT 100")
-        options['companies'] = [row[0] for row in cursor.fetchall()]
-        
-        # Get unique locations
-        cursor.execute("SELECT DISTINCT location FROM jobs WHERE location IS NOT NULL ORDER BY location LIMIT 50")
-        options['locations'] = [row[0] for row in cursor.fetchall()]
-        
-        # Get unique job types
-        cursor.execute("SELECT DISTINCT job_type FROM jobs WHERE job_type IS NOT NULL ORDER BY job_type")
-        options['job_types'] = [row[0] for row in cursor.fetchall()]
-        
-        # Get unique sites
-        cursor.execute("SELECT DISTINCT site FROM jobs ORDER BY site")
-        options['sites'] = [row[0] for row in cursor.fetchall()]
-        
-        conn.close()
-        return options 
\ No newline at end of file
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            
+            options = {}
+            
+            # Get unique companies
+            cursor.execute("SELECT DISTINCT company_name FROM jobs WHERE company_name IS NOT NULL ORDER BY company_name LIMIT 100")
+            options['companies'] = [row[0] for row in cursor.fetchall()]
+            
+            # Get unique locations
+            cursor.execute("SELECT DISTINCT location FROM jobs WHERE location IS NOT NULL ORDER BY location LIMIT 50")
+            options['locations'] = [row[0] for row in cursor.fetchall()]
+            
+            # Get unique job types
+            cursor.execute("SELECT DISTINCT job_type FROM jobs WHERE job_type IS NOT NULL ORDER BY job_type")
+            options['job_types'] = [row[0] for row in cursor.fetchall()]
+            
+            # Get unique sites
+            cursor.execute("SELECT DISTINCT site FROM jobs ORDER BY site")
+            options['sites'] = [row[0] for row in cursor.fetchall()]
+            
+            return options 
\ No newline at end of file
@@ -3,9 +3,11 @@ Database models for LokerPuller.
 """
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import NamedTuple, Optional
 from datetime import datetime
 
+from ..utils.validation import sanitize_job_row
+
 
 @dataclass
 class Job:
@@ -102,4 +104,55 @@ class Job:
     
     def is_valid(self) -> bool:
         """Check if job has required fields."""
-        return bool(self.site and self.job_url and self.title) 
\ No newline at end of file
+        return bool(self.site and self.job_url and self.title)
+
+
+class JobRecord(NamedTuple):
+    """
+    Sanitized job row, fields in JOB_COLUMNS order.
+    
+    A tuple subclass: no per-instance dict, fields at fixed offsets, and it binds
+    directly as executemany parameters, e.g. via DatabaseManager.insert_rows.
+    """
+    
+    site: str
+    job_url: str
+    job_url_direct: Optional[str]
+    title: str
+    company_name: Optional[str]
+    location: Optional[str]
+    job_type: Optional[str]
+    date_posted: Optional[str]
+    interval: Optional[str]
+    min_amount: Optional[float]
+    max_amount: Optional[float]
+    currency: Optional[str]
+    is_remote: int
+    job_level: Optional[str]
+    job_function: Optional[str]
+    company_industry: Optional[str]
+    listing_type: Optional[str]
+    emails: Optional[str]
+    description: Optional[str]
+    company_url: Optional[str]
+    company_url_direct: Optional[str]
+    company_addresses: Optional[str]
+    company_num_employees: Optional[str]
+    company_revenue: Optional[str]
+    company_description: Optional[str]
+    logo_photo_url: Optional[str]
+    banner_photo_url: Optional[str]
+    ceo_name: Optional[str]
+    ceo_photo_url: Optional[str]
+    compensation_interval: Optional[str]
+    salary_source: Optional[str]
+    company_rating: Optional[float]
+    skills: Optional[str]
+    experience_range: Optional[str]
+    country: Optional[str]
+    url_hash: int
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "JobRecord":
+        """Sanitize a raw job dictionary into a JobRecord."""
+        return cls._make(sanitize_job_row(data))
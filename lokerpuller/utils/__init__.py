@@ -4,13 +4,15 @@ Utility functions for LokerPuller.
 Contains logging, validation, and helper functions.
 """
 
-from .logging import setup_logging
-from .validation import validate_sea_country, get_sea_location_for_scraping
+from .logging import setup_logging, shutdown_logging
+from .validation import validate_sea_country, get_sea_country, get_sea_location_for_scraping
 from .constants import SEA_COUNTRIES, MEMORY_OPTIMIZED_CONFIG
 
 __all__ = [
     "setup_logging",
+    "shutdown_logging",
     "validate_sea_country", 
+    "get_sea_country",
     "get_sea_location_for_scraping",
     "SEA_COUNTRIES",
     "MEMORY_OPTIMIZED_CONFIG",
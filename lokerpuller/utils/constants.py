@@ -2,27 +2,55 @@
 Constants and configuration for LokerPuller.
 """
 
+import sys
+from types import MappingProxyType
+
+
+def _frozen(value):
+    """
+    Recursively freeze a configuration literal.
+    
+    Dicts become read-only MappingProxyType views, lists become tuples and
+    strings are interned so lookups on country and city names compare by identity.
+    
+    Args:
+        value: Dict, list or scalar to freeze
+        
+    Returns:
+        Read-only equivalent of value
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({_frozen(key): _frozen(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_frozen(item) for item in value)
+    if isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+
 # Southeast Asian countries mapping
-SEA_COUNTRIES = {
+SEA_COUNTRIES = _frozen({
     'Indonesia': ['Indonesia', 'Jakarta', 'Surabaya', 'Bandung', 'Medan'],
     'Malaysia': ['Malaysia', 'Kuala Lumpur', 'Penang', 'Johor Bahru', 'Selangor'],
     'Thailand': ['Thailand', 'Bangkok', 'Chiang Mai', 'Phuket', 'Pattaya'],
     'Vietnam': ['Vietnam', 'Ho Chi Minh City', 'Hanoi', 'Da Nang', 'Hue'],
     'Singapore': ['Singapore']
-}
+})
 
 # Configuration for e2-small optimization
-MEMORY_OPTIMIZED_CONFIG = {
+MEMORY_OPTIMIZED_CONFIG = _frozen({
     'max_results_per_site': 25,  # Reduced for memory efficiency
     'batch_delay': 10,  # Seconds between batches
-    'site_delay': 30,   # Seconds between sites
-    'country_delay': 60,  # Seconds between countries
-    'max_concurrent_processes': 1,  # Sequential processing only
+    'max_concurrent_sites': 2,  # Site scrapes in flight at once, shared by concurrent countries
+    'max_concurrent_countries': 2,  # Countries scraped concurrently by the daily run
+    'site_jitter': 5,  # Max random seconds before each site scrape starts
+    'job_queue_size': 1000,  # Scraped jobs buffered between site scrapes and the DB writer
+    'insert_batch_size': 500,  # Jobs written per database transaction
     'cleanup_frequency': 3,  # Cleanup every 3 operations
-}
+})
 
 # Southeast Asian countries with optimized search terms
-SEA_SCRAPING_CONFIG = {
+SEA_SCRAPING_CONFIG = _frozen({
     'Indonesia': {
         'location': 'Jakarta, Indonesia',
         'search_terms': ['software engineer', 'developer', 'data analyst'],
@@ -48,10 +76,45 @@ SEA_SCRAPING_CONFIG = {
         'search_terms': ['software engineer', 'developer', 'data analyst', 'product manager'],
         'sites': ['indeed', 'linkedin']
     }
-}
+})
+
+# Month names padded to 9 characters, sliced by month number in display columns
+_MONTH_NAMES_SQL = "'January  February March    April    May      June     July     August   SeptemberOctober  November December '"
+
+# Display expressions computed by SQLite when a row is written
+SALARY_DISPLAY_SQL = '''CASE
+        WHEN min_amount IS NULL OR min_amount = 0 THEN 'Not specified'
+        WHEN max_amount IS NULL OR max_amount = 0
+            THEN printf('%s %,d+', COALESCE(NULLIF(currency, ''), 'USD'), CAST(round(min_amount) AS INTEGER))
+        ELSE printf('%s %,d - %,d', COALESCE(NULLIF(currency, ''), 'USD'),
+                    CAST(round(min_amount) AS INTEGER), CAST(round(max_amount) AS INTEGER))
+    END'''
+
+DATE_POSTED_FORMATTED_SQL = f'''CASE
+        WHEN date_posted IS NULL OR date_posted = '' THEN 'Not specified'
+        WHEN date_posted GLOB '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]'
+             AND CAST(substr(date_posted, 6, 2) AS INTEGER) BETWEEN 1 AND 12
+            THEN rtrim(substr({_MONTH_NAMES_SQL}, CAST(substr(date_posted, 6, 2) AS INTEGER) * 9 - 8, 9))
+                 || ' ' || substr(date_posted, 9, 2) || ', ' || substr(date_posted, 1, 4)
+        ELSE date_posted
+    END'''
+
+SCRAPED_AT_FORMATTED_SQL = f'''CASE
+        WHEN scraped_at GLOB '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9] [0-9][0-9]:[0-9][0-9]:[0-9][0-9]'
+             AND CAST(substr(scraped_at, 6, 2) AS INTEGER) BETWEEN 1 AND 12
+            THEN rtrim(substr({_MONTH_NAMES_SQL}, CAST(substr(scraped_at, 6, 2) AS INTEGER) * 9 - 8, 9))
+                 || ' ' || substr(scraped_at, 9, 2) || ', ' || substr(scraped_at, 1, 4)
+                 || printf(' at %02d:', (CAST(substr(scraped_at, 12, 2) AS INTEGER) + 11) % 12 + 1)
+                 || substr(scraped_at, 15, 2)
+                 || CASE WHEN CAST(substr(scraped_at, 12, 2) AS INTEGER) < 12 THEN ' AM' ELSE ' PM' END
+        ELSE scraped_at
+    END'''
+
+# date_posted as epoch seconds (NULL when unparsable), so sorting by it is an index walk
+DATE_POSTED_TS_SQL = "CAST(strftime('%s', date_posted) AS INTEGER)"
 
 # Default database schema
-DEFAULT_DB_SCHEMA = '''
+DEFAULT_DB_SCHEMA = f'''
 CREATE TABLE IF NOT EXISTS jobs (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     site TEXT NOT NULL,
@@ -72,13 +135,13 @@ CREATE TABLE IF NOT EXISTS jobs (
     company_industry TEXT,
     listing_type TEXT,
     emails TEXT,
-    description TEXT,
+    description BLOB,
     company_url TEXT,
     company_url_direct TEXT,
     company_addresses TEXT,
     company_num_employees TEXT,
     company_revenue TEXT,
-    company_description TEXT,
+    company_description BLOB,
     logo_photo_url TEXT,
     banner_photo_url TEXT,
     ceo_name TEXT,
@@ -89,15 +152,175 @@ CREATE TABLE IF NOT EXISTS jobs (
     skills TEXT,
     experience_range TEXT,
     scraped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    UNIQUE(job_url, site)
+    country TEXT,
+    url_hash INTEGER NOT NULL,
+    salary_display TEXT GENERATED ALWAYS AS ({SALARY_DISPLAY_SQL}) STORED,
+    date_posted_formatted TEXT GENERATED ALWAYS AS ({DATE_POSTED_FORMATTED_SQL}) STORED,
+    scraped_at_formatted TEXT GENERATED ALWAYS AS ({SCRAPED_AT_FORMATTED_SQL}) STORED,
+    date_posted_ts INTEGER GENERATED ALWAYS AS ({DATE_POSTED_TS_SQL}) VIRTUAL
 )
 '''
 
+# Columns added to databases created before they joined DEFAULT_DB_SCHEMA, as
+# (column, definition, backfill SQL or None). SQLite can only ALTER TABLE ADD
+# generated columns as VIRTUAL. Backfills may call sea_country(location) and
+# url_hash(site, job_url).
+DB_COLUMN_MIGRATIONS = [
+    ('salary_display', f'TEXT GENERATED ALWAYS AS ({SALARY_DISPLAY_SQL}) VIRTUAL', None),
+    ('date_posted_formatted', f'TEXT GENERATED ALWAYS AS ({DATE_POSTED_FORMATTED_SQL}) VIRTUAL', None),
+    ('scraped_at_formatted', f'TEXT GENERATED ALWAYS AS ({SCRAPED_AT_FORMATTED_SQL}) VIRTUAL', None),
+    ('date_posted_ts', f'INTEGER GENERATED ALWAYS AS ({DATE_POSTED_TS_SQL}) VIRTUAL', None),
+    ('country', 'TEXT', 'UPDATE jobs SET country = sea_country(location)'),
+    ('url_hash', 'INTEGER', 'UPDATE jobs SET url_hash = url_hash(site, job_url)'),
+]
+
+# Columns written by DatabaseManager.insert_jobs, in placeholder order
+JOB_COLUMNS = (
+    'site', 'job_url', 'job_url_direct', 'title', 'company_name', 'location',
+    'job_type', 'date_posted', 'interval', 'min_amount', 'max_amount', 'currency',
+    'is_remote', 'job_level', 'job_function', 'company_industry', 'listing_type',
+    'emails', 'description', 'company_url', 'company_url_direct', 'company_addresses',
+    'company_num_employees', 'company_revenue', 'company_description',
+    'logo_photo_url', 'banner_photo_url', 'ceo_name', 'ceo_photo_url',
+    'compensation_interval', 'salary_source', 'company_rating', 'skills', 'experience_range',
+    'country', 'url_hash',
+)
+
+# jobspy DataFrame columns whose database column has a different name
+FRAME_COLUMN_RENAMES = {
+    'company': 'company_name',
+    'company_logo': 'logo_photo_url',
+}
+
+# jobspy DataFrame columns that end up in JOB_COLUMNS; the rest are dropped on arrival
+_FRAME_COLUMN_SOURCES = {column: source for source, column in FRAME_COLUMN_RENAMES.items()}
+SCRAPED_COLUMNS = tuple(
+    _FRAME_COLUMN_SOURCES.get(column, column)
+    for column in JOB_COLUMNS
+    if column not in ('country', 'url_hash')
+)
+
+# Long free-text columns stored zlib-compressed; never filtered with LIKE
+COMPRESSED_COLUMNS = ('description', 'company_description')
+
+# Connection settings applied once to every SQLite connection
+SQLITE_PRAGMAS = [
+    'PRAGMA journal_mode=WAL',  # Readers no longer block on the scraper's writes
+    'PRAGMA synchronous=NORMAL',  # Safe with WAL, avoids an fsync per commit
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA mmap_size=268435456',  # 256MB memory-mapped reads
+    'PRAGMA cache_size=-65536',  # 64MB page cache
+    'PRAGMA busy_timeout=5000',  # Wait for other processes' writes instead of failing
+]
+
+# Per-row contributions of a job to the job_stats counters; {row} is NEW or OLD
+_JOB_STATS_TERMS = """
+    ('total', {sign}1),
+    ('country:' || COALESCE({row}.country, 'Other'), {sign}1),
+    ('site:' || {row}.site, {sign}1),
+    ('remote', {sign}({row}.is_remote = 1)),
+    ('salary_jobs', {sign}({row}.min_amount IS NOT NULL OR {row}.max_amount IS NOT NULL)),
+    ('min_amount_sum', {sign}COALESCE({row}.min_amount, 0)),
+    ('min_amount_count', {sign}({row}.min_amount IS NOT NULL)),
+    ('max_amount_sum', {sign}COALESCE({row}.max_amount, 0)),
+    ('max_amount_count', {sign}({row}.max_amount IS NOT NULL))"""
+
+_JOB_STATS_UPSERT = "INSERT INTO job_stats (key, value) VALUES {terms} ON CONFLICT(key) DO UPDATE SET value = value + excluded.value;"
+
+# Summary counters kept current by triggers, so get_statistics reads O(#categories) rows
+JOB_STATS_SCHEMA = [
+    """CREATE TABLE IF NOT EXISTS job_stats (
+        key TEXT PRIMARY KEY,
+        value NUMERIC NOT NULL DEFAULT 0
+    )""",
+    f"""CREATE TRIGGER IF NOT EXISTS trg_jobs_stats_insert AFTER INSERT ON jobs BEGIN
+        {_JOB_STATS_UPSERT.format(terms=_JOB_STATS_TERMS.format(sign='', row='NEW'))}
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS trg_jobs_stats_delete AFTER DELETE ON jobs BEGIN
+        {_JOB_STATS_UPSERT.format(terms=_JOB_STATS_TERMS.format(sign='-', row='OLD'))}
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS trg_jobs_stats_update
+    AFTER UPDATE OF country, site, is_remote, min_amount, max_amount ON jobs BEGIN
+        {_JOB_STATS_UPSERT.format(terms=_JOB_STATS_TERMS.format(sign='-', row='OLD'))}
+        {_JOB_STATS_UPSERT.format(terms=_JOB_STATS_TERMS.format(sign='', row='NEW'))}
+    END""",
+]
+
+# Trigram full-text index over the text search columns. Trigrams keep the
+# case-insensitive substring semantics of LIKE '%q%' for terms of 3+ characters.
+JOB_FTS_SCHEMA = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+        title, company_name, location,
+        content='jobs', content_rowid='id', tokenize='trigram'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS trg_jobs_fts_insert AFTER INSERT ON jobs BEGIN
+        INSERT INTO jobs_fts (rowid, title, company_name, location)
+        VALUES (NEW.id, NEW.title, NEW.company_name, NEW.location);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS trg_jobs_fts_delete AFTER DELETE ON jobs BEGIN
+        INSERT INTO jobs_fts (jobs_fts, rowid, title, company_name, location)
+        VALUES ('delete', OLD.id, OLD.title, OLD.company_name, OLD.location);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS trg_jobs_fts_update AFTER UPDATE OF title, company_name, location ON jobs BEGIN
+        INSERT INTO jobs_fts (jobs_fts, rowid, title, company_name, location)
+        VALUES ('delete', OLD.id, OLD.title, OLD.company_name, OLD.location);
+        INSERT INTO jobs_fts (rowid, title, company_name, location)
+        VALUES (NEW.id, NEW.title, NEW.company_name, NEW.location);
+    END""",
+]
+
+# Shortest search term the trigram index can match; shorter ones fall back to LIKE
+FTS_MIN_TERM_LENGTH = 3
+
+# Recomputes every job_stats counter from the jobs table
+JOB_STATS_REBUILD_SQL = """
+DELETE FROM job_stats;
+INSERT INTO job_stats (key, value)
+    SELECT 'total', COUNT(*) FROM jobs
+    UNION ALL SELECT 'remote', COUNT(*) FILTER (WHERE is_remote = 1) FROM jobs
+    UNION ALL SELECT 'salary_jobs', COUNT(*) FILTER (WHERE min_amount IS NOT NULL OR max_amount IS NOT NULL) FROM jobs
+    UNION ALL SELECT 'min_amount_sum', COALESCE(SUM(min_amount), 0) FROM jobs
+    UNION ALL SELECT 'min_amount_count', COUNT(min_amount) FROM jobs
+    UNION ALL SELECT 'max_amount_sum', COALESCE(SUM(max_amount), 0) FROM jobs
+    UNION ALL SELECT 'max_amount_count', COUNT(max_amount) FROM jobs
+    UNION ALL SELECT 'country:' || COALESCE(country, 'Other'), COUNT(*) FROM jobs GROUP BY 1
+    UNION ALL SELECT 'site:' || site, COUNT(*) FROM jobs GROUP BY 1;
+"""
+
 # Database indexes for performance
 DB_INDEXES = [
-    'CREATE INDEX IF NOT EXISTS idx_site ON jobs(site)',
     'CREATE INDEX IF NOT EXISTS idx_location ON jobs(location)',
     'CREATE INDEX IF NOT EXISTS idx_scraped_at ON jobs(scraped_at)',
     'CREATE INDEX IF NOT EXISTS idx_company ON jobs(company_name)',
     'CREATE INDEX IF NOT EXISTS idx_title ON jobs(title)',
-] 
\ No newline at end of file
+    # Deduplicates on the 64-bit hash of (site, job_url): new tables carry no
+    # UNIQUE(job_url, site), so inserts compare integers rather than long URLs
+    'CREATE UNIQUE INDEX IF NOT EXISTS idx_url_hash ON jobs(url_hash)',
+    # Let MIN(min_amount) / MAX(max_amount) in get_statistics read one index entry
+    'CREATE INDEX IF NOT EXISTS idx_min_amount ON jobs(min_amount)',
+    'CREATE INDEX IF NOT EXISTS idx_max_amount ON jobs(max_amount)',
+    # Serves ORDER BY date_posted, which is translated through SORT_COLUMNS
+    'CREATE INDEX IF NOT EXISTS idx_date_posted_ts ON jobs(date_posted_ts)',
+    # Composite indexes matching the equality filters of search_jobs plus its default sort
+    'CREATE INDEX IF NOT EXISTS idx_site_scraped_at ON jobs(site, scraped_at)',
+    'CREATE INDEX IF NOT EXISTS idx_job_type_scraped_at ON jobs(job_type, scraped_at)',
+    'CREATE INDEX IF NOT EXISTS idx_remote_scraped_at ON jobs(is_remote, scraped_at)',
+    'CREATE INDEX IF NOT EXISTS idx_country_scraped_at ON jobs(country, scraped_at)',
+    # Superseded by idx_country_scraped_at / idx_site_scraped_at, which also serve
+    # plain country and site lookups and DISTINCT site; each index costs every INSERT
+    'DROP INDEX IF EXISTS idx_country',
+    'DROP INDEX IF EXISTS idx_site',
+]
+
+# Schema, statistics triggers and indexes as one script for a single
+# executescript() call instead of one execute() per statement. Migrations for
+# an existing jobs table must run first: the indexes cover migrated columns.
+DEFAULT_DB_INIT_SQL = ';\n'.join(
+    [DEFAULT_DB_SCHEMA.strip(), *JOB_STATS_SCHEMA, *DB_INDEXES]
+) + ';'
+
+# Columns search_jobs is allowed to sort by
+VALID_SORT_FIELDS = ('title', 'company_name', 'location', 'min_amount', 'max_amount', 'date_posted', 'scraped_at')
+
+# Sort fields ordered by a different, indexed column
+SORT_COLUMNS = {'date_posted': 'date_posted_ts'}
\ No newline at end of file
@@ -2,9 +2,166 @@
 Logging utilities for LokerPuller.
 """
 
+import atexit
 import logging
 import os
-from typing import Optional
+import queue
+import re
+import signal
+import threading
+import time
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional
+
+
+# Bytes of log output buffered in memory before the file is written
+LOG_BUFFER_SIZE = 1 << 16
+
+# MemTotal and MemAvailable are the first and third lines of /proc/meminfo
+_MEMINFO_HEAD_BYTES = 256
+_MEMINFO_RE = re.compile(rb'MemTotal:\s+(\d+).*?MemAvailable:\s+(\d+)', re.S)
+
+# Shared by every handler setup_logging installs
+_FORMATTER = logging.Formatter(
+    '%(asctime)s | %(levelname)-8s | %(name)-15s | %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    File handler that writes through a large buffer instead of flushing per record.
+    
+    StreamHandler flushes after every record, costing a write() each. Here the
+    buffer is written when full, on records at flush_level or above, and when
+    the handler is flushed or closed, which logging.shutdown does at exit.
+    """
+    
+    def __init__(self, filename: str, buffer_size: int = LOG_BUFFER_SIZE,
+                 flush_level: int = logging.ERROR, encoding: Optional[str] = 'utf-8'):
+        """
+        Initialize the handler; the file is opened on the first record.
+        
+        Args:
+            filename: Log file path, opened in append mode
+            buffer_size: Size of the write buffer in bytes
+            flush_level: Records at this level or above are written immediately
+            encoding: File encoding
+        """
+        self.buffer_size = buffer_size
+        self.flush_level = flush_level
+        super().__init__(filename, encoding=encoding, delay=True)
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding, errors=self.errors)
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        if self.stream is None:
+            if self.mode != 'w' or not self._closed:
+                self.stream = self._open()
+        if self.stream is None:
+            return
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= self.flush_level:
+                self.stream.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class _InProcessQueueHandler(QueueHandler):
+    """
+    QueueHandler feeding a listener thread in this process.
+    
+    The stock prepare() runs the Formatter on the calling thread so records can
+    be pickled; in-process they only need their message bound, which leaves
+    timestamps, padding and tracebacks to the listener thread.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Bind the arguments now; callers may mutate them after logging returns
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+# Listeners started by setup_logging, keyed by logger name, stopped by shutdown_logging
+_listeners: Dict[str, QueueListener] = {}
+_listeners_lock = threading.Lock()
+
+
+def _console_handler() -> logging.Handler:
+    """
+    Create a console handler using the shared formatter.
+    
+    Returns:
+        StreamHandler writing to stderr
+    """
+    handler = logging.StreamHandler()
+    handler.setFormatter(_FORMATTER)
+    return handler
+
+
+def _offload_handlers(logger: logging.Logger, *handlers: logging.Handler) -> None:
+    """
+    Attach handlers to a logger through a background QueueListener thread.
+    
+    Only handlers created by setup_logging are passed in; handlers someone
+    else installed (pytest's caplog, a WSGI server, a host application's
+    config) stay on the logger and keep running on the calling thread.
+    
+    Args:
+        logger: Logger the handlers should serve
+        handlers: Handlers to run off the calling thread
+    """
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    logger.addHandler(_InProcessQueueHandler(log_queue))
+    listener.start()
+    
+    with _listeners_lock:
+        if not _listeners:
+            # Registered after logging's own hook, so it runs first: queued records
+            # are handled before logging.shutdown flushes and closes the handlers
+            atexit.register(shutdown_logging)
+        previous = _listeners.pop(logger.name, None)
+        _listeners[logger.name] = listener
+    
+    # The logger was reconfigured; retire the handlers it used before
+    if previous is not None:
+        previous.stop()
+        for handler in previous.handlers:
+            handler.close()
+
+
+def shutdown_logging() -> None:
+    """Stop the background logging threads once every queued record is handled."""
+    with _listeners_lock:
+        listeners = list(_listeners.values())
+        _listeners.clear()
+    for listener in listeners:
+        listener.stop()
+
+
+def _exit_on_sigterm(signum, frame) -> None:
+    """Turn SIGTERM into a normal exit so atexit hooks flush buffered logs."""
+    raise SystemExit(128 + signum)
+
+
+def exit_cleanly_on_sigterm() -> None:
+    """
+    Make SIGTERM (docker stop, supervisor) exit through SystemExit.
+    
+    Buffered log records are then written by the exit hooks instead of being
+    lost with the process. Only the command line entry points call this, since
+    they own the process; a host application keeps its own signal handling.
+    """
+    if signal.getsignal(signal.SIGTERM) is signal.SIG_DFL:
+        signal.signal(signal.SIGTERM, _exit_on_sigterm)
 
 
 def setup_logging(
@@ -23,41 +180,45 @@ def setup_logging(
     Returns:
         Configured logger instance
     """
-    # Create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s | %(levelname)-8s | %(name)-15s | %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    
-    # Configure root logger
-    logging.basicConfig(
-        level=level,
-        format='%(asctime)s | %(levelname)-8s | %(name)-15s | %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+    # Non-LokerPuller loggers (werkzeug, urllib3, ...) print through the root
+    # logger; its console output runs on a listener thread, callers only enqueue
+    root_logger = logging.getLogger()
+    if not root_logger.handlers:
+        root_logger.setLevel(level)
+        _offload_handlers(root_logger, _console_handler())
     
-    # Create logger
+    # Create logger; it has its own console handler, so records are not also
+    # formatted and printed a second time by the root logger
     logger = logging.getLogger(name)
     logger.setLevel(level)
+    logger.propagate = False
+    logger.handlers.clear()
+    handlers = [_console_handler()]
     
     # Add file handler if specified
     if log_file:
         # Ensure log directory exists
         log_dir = os.path.dirname(log_file)
-        if log_dir and not os.path.exists(log_dir):
+        if log_dir:
             os.makedirs(log_dir, exist_ok=True)
             
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        file_handler = BufferedFileHandler(log_file)
+        file_handler.setFormatter(_FORMATTER)
+        handlers.append(file_handler)
+    
+    # Console and file output happen on a listener thread; callers only enqueue
+    _offload_handlers(logger, *handlers)
     
     return logger
 
 
+@lru_cache(maxsize=None)
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance with the standard LokerPuller format.
     
+    Loggers live for the whole process, so each name is resolved only once.
+    
     Args:
         name: Logger name (will be prefixed with 'LokerPuller.')
         
@@ -74,33 +235,35 @@ def log_system_resources(logger: logging.Logger) -> None:
     Args:
         logger: Logger instance to use
     """
+    # Skip the /proc reads entirely when the records would be discarded
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    
     try:
         # Get memory info (Linux/Unix systems)
         if os.path.exists('/proc/meminfo'):
-            with open('/proc/meminfo', 'r') as f:
-                meminfo = f.read()
+            with open('/proc/meminfo', 'rb') as f:
+                match = _MEMINFO_RE.search(f.read(_MEMINFO_HEAD_BYTES))
             
             mem_total = None
             mem_available = None
-            for line in meminfo.split('\n'):
-                if 'MemTotal:' in line:
-                    mem_total = int(line.split()[1]) // 1024  # Convert to MB
-                elif 'MemAvailable:' in line:
-                    mem_available = int(line.split()[1]) // 1024  # Convert to MB
+            if match:
+                mem_total = int(match[1]) // 1024  # Convert to MB
+                mem_available = int(match[2]) // 1024  # Convert to MB
             
             if mem_total and mem_available:
                 mem_used = mem_total - mem_available
                 mem_percent = (mem_used / mem_total) * 100
-                logger.info(f"💾 Memory: {mem_used}MB/{mem_total}MB ({mem_percent:.1f}% used)")
+                logger.info("💾 Memory: %sMB/%sMB (%.1f%% used)", mem_used, mem_total, mem_percent)
         
         # Get load average (Linux/Unix systems)
         if os.path.exists('/proc/loadavg'):
             with open('/proc/loadavg', 'r') as f:
                 load_avg = f.read().strip().split()[0]
-            logger.info(f"⚡ Load average: {load_avg}")
+            logger.info("⚡ Load average: %s", load_avg)
         
     except Exception as e:
-        logger.debug(f"Could not read system resources: {e}")
+        logger.debug("Could not read system resources: %s", e)
 
 
 def cleanup_old_logs(log_dir: str, days_to_keep: int = 7) -> None:
@@ -111,17 +274,17 @@ def cleanup_old_logs(log_dir: str, days_to_keep: int = 7) -> None:
         log_dir: Directory containing log files
         days_to_keep: Number of days to keep logs
     """
-    if not os.path.exists(log_dir):
-        return
+    try:
+        entries = os.scandir(log_dir)
+    except (FileNotFoundError, NotADirectoryError):
+        return  # No log directory, nothing to clean up
         
-    import time
-    from pathlib import Path
-    
     cutoff_time = time.time() - (days_to_keep * 24 * 60 * 60)
     
-    for log_file in Path(log_dir).glob("*.log"):
-        if log_file.stat().st_mtime < cutoff_time:
-            try:
-                log_file.unlink()
-            except OSError:
-                pass  # Ignore errors when deleting log files 
\ No newline at end of file
+    with entries:
+        for entry in entries:
+            if entry.name.endswith('.log') and entry.stat().st_mtime < cutoff_time:
+                try:
+                    os.unlink(entry.path)
+                except OSError:
+                    pass  # Ignore errors when deleting log files
@@ -0,0 +1,29 @@
+"""
+Shared fixtures for LokerPuller tests.
+"""
+
+import pytest
+
+from lokerpuller.database.manager import DatabaseManager
+
+
+@pytest.fixture
+def db(tmp_path):
+    """DatabaseManager on a fresh database file, closed after the test."""
+    manager = DatabaseManager(str(tmp_path / 'jobs.db'))
+    yield manager
+    manager.close()
+
+
+def make_job(index: int, **fields) -> dict:
+    """Build a raw job dictionary, as scrapers hand to insert_jobs."""
+    job = {
+        'site': 'indeed',
+        'job_url': f'https://example.com/jobs/{index}',
+        'title': f'Software Engineer {index}',
+        'company_name': f'Company {index % 3}',
+        'location': 'Jakarta, Indonesia',
+        'date_posted': '2024-01-01',
+    }
+    job.update(fields)
+    return job
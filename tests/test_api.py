@@ -0,0 +1,99 @@
+"""
+Tests for the LokerPuller REST API.
+"""
+
+import pytest
+
+from lokerpuller.api.app import create_app, run_app
+from lokerpuller.config.settings import get_settings
+from lokerpuller.database.manager import DatabaseManager
+
+from .conftest import make_job
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    """Test client for an app backed by a database seeded with seven jobs."""
+    monkeypatch.setenv('DB_PATH', str(tmp_path / 'jobs.db'))
+    monkeypatch.setenv('LOG_PATH', str(tmp_path / 'logs'))
+    get_settings.cache_clear()
+
+    db = DatabaseManager(str(tmp_path / 'jobs.db'))
+    db.insert_jobs([make_job(i) for i in range(7)])
+    db.close()
+
+    yield create_app().test_client()
+    get_settings.cache_clear()
+
+def _job_ids(response) -> list:
+    """Ids of the jobs in an /api/jobs response, in page order."""
+    return [job['id'] for job in response.get_json()['jobs']]
+
+
+def test_cursor_pagination_walks_every_job_once(client):
+    """Test that following next_cursor visits each job once and stops on the last page."""
+    first = client.get('/api/jobs?per_page=3')
+    assert first.status_code == 200
+    pagination = first.get_json()['pagination']
+    assert pagination['total_count'] == 7 and pagination['has_next']
+
+    seen = _job_ids(first)
+    cursor = pagination['next_cursor']
+    pages = 1
+    while cursor:
+        response = client.get(f'/api/jobs?per_page=3&cursor={cursor}')
+        assert response.status_code == 200
+        pagination = response.get_json()['pagination']
+        assert 'total_count' not in pagination
+        seen += _job_ids(response)
+        cursor = pagination['next_cursor']
+        pages += 1
+
+    # Jobs share scraped_at, so the id tie-break keeps pages disjoint
+    assert pages == 3
+    assert seen == sorted(seen, reverse=True) == list(range(7, 0, -1))
+    assert pagination['has_next'] is False
+
+
+def test_cursor_on_exact_last_page(client):
+    """Test that a page ending exactly on the last job reports no next page."""
+    first = client.get('/api/jobs?per_page=4').get_json()
+    last = client.get(f"/api/jobs?per_page=3&cursor={first['pagination']['next_cursor']}").get_json()
+
+    assert [job['id'] for job in last['jobs']] == [3, 2, 1]
+    assert last['pagination']['has_next'] is False
+    assert last['pagination']['next_cursor'] is None
+
+
+def test_bad_cursor_is_rejected(client):
+    """Test that malformed cursors and cursors on other orderings return 400."""
+    assert client.get('/api/jobs?cursor=not-a-cursor').status_code == 400
+    assert client.get('/api/jobs?cursor=Zm9v').status_code == 400
+
+    cursor = client.get('/api/jobs?per_page=3').get_json()['pagination']['next_cursor']
+    assert client.get(f'/api/jobs?cursor={cursor}&sort_by=title').status_code == 400
+
+
+def test_aggregates_revalidate_with_etag(client):
+    """Test that stats and filter responses carry an ETag that answers 304 when unchanged."""
+    for url in ('/api/jobs/stats', '/api/jobs/filters'):
+        response = client.get(url)
+        assert response.status_code == 200
+        assert response.get_json()
+        etag = response.headers['ETag']
+
+        revalidated = client.get(url, headers={'If-None-Match': etag})
+        assert revalidated.status_code == 304
+        assert revalidated.headers['ETag'] == etag
+
+    assert client.get('/api/jobs/stats').get_json()['total_jobs'] == 7
+
+
+def test_run_app_shuts_down_scrape_executor(client, monkeypatch):
+    """Test that stopping the server cancels queued scrapes instead of running them at exit."""
+    app = client.application
+    monkeypatch.setattr(app, 'run', lambda **kwargs: None)
+    run_app(app, get_settings())
+
+    with pytest.raises(RuntimeError):
+        app.extensions['scrape_executor'].submit(print)
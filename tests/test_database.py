@@ -0,0 +1,381 @@
+"""
+Tests for DatabaseManager storage, search and statistics.
+"""
+
+import sqlite3
+import threading
+import zlib
+
+import pytest
+
+from lokerpuller.database.manager import COMPRESS_MIN_LENGTH, CONNECTION_POOL_SIZE, DatabaseManager
+from lokerpuller.database.models import JobRecord
+from lokerpuller.utils.constants import JOB_COLUMNS
+
+from .conftest import make_job
+
+
+# jobs table as created by the first release, before any migration
+BASELINE_SCHEMA = '''
+CREATE TABLE jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    site TEXT NOT NULL,
+    job_url TEXT NOT NULL,
+    job_url_direct TEXT,
+    title TEXT,
+    company_name TEXT,
+    location TEXT,
+    job_type TEXT,
+    date_posted TEXT,
+    interval TEXT,
+    min_amount REAL,
+    max_amount REAL,
+    currency TEXT,
+    is_remote INTEGER DEFAULT 0,
+    job_level TEXT,
+    job_function TEXT,
+    company_industry TEXT,
+    listing_type TEXT,
+    emails TEXT,
+    description TEXT,
+    company_url TEXT,
+    company_url_direct TEXT,
+    company_addresses TEXT,
+    company_num_employees TEXT,
+    company_revenue TEXT,
+    company_description TEXT,
+    logo_photo_url TEXT,
+    banner_photo_url TEXT,
+    ceo_name TEXT,
+    ceo_photo_url TEXT,
+    compensation_interval TEXT,
+    salary_source TEXT,
+    company_rating REAL,
+    skills TEXT,
+    experience_range TEXT,
+    scraped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(job_url, site)
+)
+'''
+
+TEXT_JOBS = [
+    make_job(1, title='Senior Python Developer', company_name='Acme Corp', location='Jakarta, Indonesia'),
+    make_job(2, title='Data Analyst', company_name='Beta "Quoted" Ltd', location='Bangkok, Thailand'),
+    make_job(3, title='QA Engineer (Go)', company_name='Gamma', location='Hanoi, Vietnam'),
+    make_job(4, title='python backend engineer', company_name='acme labs', location='Kuala Lumpur, Malaysia'),
+    make_job(5, title='Product Manager', company_name=None, location='Singapore'),
+]
+
+
+def _ids(db: DatabaseManager, filters: dict) -> set:
+    """Ids of every job search_jobs returns for the filters."""
+    jobs, total = db.search_jobs(filters, per_page=100)
+    assert total == len(jobs)
+    return {job['id'] for job in jobs}
+
+
+def _like_ids(db: DatabaseManager, column: str, term: str) -> set:
+    """Ids the pre-FTS LIKE '%term%' filter matched."""
+    conn = sqlite3.connect(db.db_path)
+    try:
+        return {row[0] for row in conn.execute(f"SELECT id FROM jobs WHERE {column} LIKE ?", (f'%{term}%',))}
+    finally:
+        conn.close()
+
+
+def _recomputed_stats(db: DatabaseManager) -> dict:
+    """Statistics computed straight from the jobs table, for comparison with job_stats."""
+    conn = sqlite3.connect(db.db_path)
+    try:
+        total, remote, with_salary = conn.execute("""
+            SELECT COUNT(*), COUNT(*) FILTER (WHERE is_remote = 1),
+                   COUNT(*) FILTER (WHERE min_amount IS NOT NULL OR max_amount IS NOT NULL)
+            FROM jobs
+        """).fetchone()
+        by_country = dict(conn.execute("SELECT COALESCE(country, 'Other'), COUNT(*) FROM jobs GROUP BY 1"))
+        by_site = dict(conn.execute("SELECT site, COUNT(*) FROM jobs GROUP BY 1"))
+    finally:
+        conn.close()
+    return {'total': total, 'remote': remote, 'salary': with_salary, 'country': by_country, 'site': by_site}
+
+
+def _assert_stats_current(db: DatabaseManager) -> None:
+    """Check that the trigger-maintained statistics match the table."""
+    expected = _recomputed_stats(db)
+    stats = db.get_statistics()
+
+    assert stats['total_jobs'] == expected['total']
+    assert stats['salary_stats']['jobs_with_salary'] == expected['salary']
+    assert {item['country']: item['count'] for item in stats['jobs_by_country']} == expected['country']
+    assert {item['site']: item['count'] for item in stats['jobs_by_site']} == expected['site']
+    if expected['total']:
+        assert stats['remote_percentage'] == expected['remote'] / expected['total'] * 100
+
+
+def test_job_record_fields_match_job_columns():
+    """Test that JobRecord rows bind in INSERT_JOB_SQL column order."""
+    assert JobRecord._fields == JOB_COLUMNS
+
+
+def test_insert_search_stats_delete(db):
+    """Test the insert, search, statistics and cleanup path end to end."""
+    jobs = [
+        make_job(i, site='indeed' if i % 2 else 'linkedin', is_remote=i % 3 == 0,
+                 min_amount=1000 * i if i % 4 else None, location=location)
+        for i, location in enumerate(['Jakarta', 'Bangkok', 'Hanoi', 'Penang', 'Singapore', 'Paris'] * 3)
+    ]
+
+    # Paris is outside SEA and skipped
+    assert db.insert_jobs(jobs) == 15
+    assert _ids(db, {}) == set(range(1, 16))
+    assert _ids(db, {'country': 'Thailand'}) == _like_ids(db, 'location', 'Bangkok')
+    assert _ids(db, {'site': 'linkedin'}) and all(
+        job['site'] == 'linkedin' for job in db.search_jobs({'site': 'linkedin'}, per_page=100)[0]
+    )
+    _assert_stats_current(db)
+
+    # Age a third of the jobs past the cleanup cutoff
+    conn = sqlite3.connect(db.db_path)
+    with conn:
+        conn.execute("UPDATE jobs SET scraped_at = '2000-01-01 00:00:00' WHERE id % 3 = 0")
+    conn.close()
+
+    assert db.cleanup_old_jobs(days=14) == 5
+    assert _ids(db, {}) == {i for i in range(1, 16) if i % 3}
+    assert _ids(db, {'title': 'Software Engineer 2'}) == set()
+    _assert_stats_current(db)
+
+
+def test_cleanup_cutoff_uses_utc_like_scraped_at(db):
+    """Test that cleanup measures job age against the UTC clock CURRENT_TIMESTAMP writes."""
+    db.insert_jobs([make_job(1), make_job(2), make_job(3)])
+
+    conn = sqlite3.connect(db.db_path)
+    with conn:
+        conn.execute("UPDATE jobs SET scraped_at = datetime('now', '-14 days', '+1 hour') WHERE id = 1")
+        conn.execute("UPDATE jobs SET scraped_at = datetime('now', '-14 days', '-1 hour') WHERE id = 2")
+    conn.close()
+
+    assert db.cleanup_old_jobs(days=14) == 1
+    assert _ids(db, {}) == {1, 3}
+    assert _ids(db, {'days_old': 14}) == {1, 3}
+
+
+def test_fts_matches_like_semantics(db):
+    """Test that MATCH-served text filters return what the LIKE filters returned."""
+    assert db.insert_jobs(TEXT_JOBS) == len(TEXT_JOBS)
+    assert db._fts_enabled
+
+    cases = [
+        ('title', 'title', 'python'), ('title', 'title', 'PYTHON'), ('title', 'title', 'eng'),
+        ('title', 'title', 'Go'), ('title', 'title', 'QA'), ('title', 'title', '(Go)'),
+        ('title', 'title', 'a'), ('title', 'title', 'nowhere'),
+        ('company', 'company_name', 'acme'), ('company', 'company_name', '"Quoted"'),
+        ('company', 'company_name', 'Ltd'), ('location', 'location', 'kuala lumpur'),
+        ('location', 'location', 'an'), ('country', 'location', 'Remote'),
+    ]
+    for filter_name, column, term in cases:
+        assert _ids(db, {filter_name: term}) == _like_ids(db, column, term), (filter_name, term)
+
+    # Several text filters combine into one MATCH with AND semantics
+    assert _ids(db, {'title': 'engineer', 'company': 'acme'}) == (
+        _like_ids(db, 'title', 'engineer') & _like_ids(db, 'company_name', 'acme')
+    )
+
+
+def test_updates_keep_fts_and_stats_in_sync(db):
+    """Test that the update triggers maintain jobs_fts and job_stats."""
+    db.insert_jobs(TEXT_JOBS)
+
+    conn = sqlite3.connect(db.db_path)
+    with conn:
+        conn.execute("UPDATE jobs SET title = 'Rust Developer', country = 'Malaysia', site = 'bayt' WHERE id = 1")
+    conn.close()
+
+    assert _ids(db, {'title': 'rust'}) == {1}
+    assert 1 not in _ids(db, {'title': 'python'})
+    _assert_stats_current(db)
+
+
+def test_writes_invalidate_cached_results(db):
+    """Test that insert and cleanup drop cached aggregates instead of waiting for the TTL."""
+    db.insert_jobs([make_job(1)])
+    assert db.get_cached('sites', db.get_filter_options, ttl=3600)['sites'] == ['indeed']
+
+    db.insert_jobs([make_job(2, site='linkedin')])
+    assert db.get_cached('sites', db.get_filter_options, ttl=3600)['sites'] == ['indeed', 'linkedin']
+
+    conn = sqlite3.connect(db.db_path)
+    with conn:
+        conn.execute("UPDATE jobs SET scraped_at = '2000-01-01 00:00:00' WHERE site = 'linkedin'")
+    conn.close()
+    db.cleanup_old_jobs(days=14)
+    assert db.get_cached('sites', db.get_filter_options, ttl=3600)['sites'] == ['indeed']
+
+
+def test_cache_drops_values_loaded_across_a_write(db):
+    """Test that a value loaded while a write committed is returned but not kept."""
+    def loader():
+        db.invalidate_caches()
+        return 'stale'
+
+    assert db.get_cached('key', loader, ttl=3600) == 'stale'
+    assert db.get_cached('key', lambda: 'fresh', ttl=3600) == 'fresh'
+
+
+def test_url_hash_dedup(db):
+    """Test that a posting is stored once per (site, job_url), within and across batches."""
+    job = make_job(1)
+
+    assert db.insert_jobs([job, dict(job, title='Duplicate in batch')]) == 1
+    assert db.insert_jobs([dict(job, title='Duplicate later')]) == 0
+    assert db.insert_jobs([dict(job, site='linkedin')]) == 1
+
+    titles = sorted(job['title'] for job in db.search_jobs(per_page=10)[0])
+    assert titles == ['Software Engineer 1', 'Software Engineer 1']
+    assert db.get_statistics()['total_jobs'] == 2
+
+
+def test_compressed_columns_round_trip(db):
+    """Test that long descriptions are stored compressed and read back unchanged."""
+    long_text = ' '.join(['Build and ship features.'] * 40)
+    short_text = 'Short description'
+    assert len(long_text) >= COMPRESS_MIN_LENGTH > len(short_text)
+
+    db.insert_jobs([
+        make_job(1, description=long_text, company_description=long_text),
+        make_job(2, description=short_text),
+    ])
+
+    conn = sqlite3.connect(db.db_path)
+    stored = dict(conn.execute("SELECT id, description FROM jobs"))
+    conn.close()
+    assert zlib.decompress(stored[1]).decode() == long_text
+    assert stored[2] == short_text
+
+    jobs = {job['id']: job for job in db.search_jobs(per_page=10)[0]}
+    assert jobs[1]['description'] == long_text
+    assert jobs[1]['company_description'] == long_text
+    assert jobs[2]['description'] == short_text
+
+    # The JSON path decompresses inside SQLite
+    import orjson
+    columns, rows = db.iter_search_rows(per_page=10, as_json=True)
+    decoded = {job['id']: job for job in (orjson.loads(row[0]) for row in rows)}
+    assert decoded[1]['description'] == long_text
+    assert decoded[2]['description'] == short_text
+
+
+def test_search_pagination(db):
+    """Test OFFSET pages, keyset pages and the totals reported with them."""
+    db.insert_jobs([make_job(i) for i in range(7)])
+
+    first, total = db.search_jobs(page=1, per_page=3)
+    last, _ = db.search_jobs(page=3, per_page=3)
+    beyond, beyond_total = db.search_jobs(page=4, per_page=3)
+    assert total == 7 and len(first) == 3 and len(last) == 1
+    assert beyond == [] and beyond_total == 7
+
+    seek = db.search_jobs_seek({}, first[-1]['scraped_at'], first[-1]['id'], limit=3)
+    assert [job['id'] for job in seek] == [job['id'] for job in db.search_jobs(page=2, per_page=3)[0]]
+
+
+def test_managers_on_one_file_share_the_write_lock(db, tmp_path):
+    """Test that every manager on a database file serializes writes on one lock."""
+    other = DatabaseManager(str(tmp_path / '.' / 'jobs.db'))
+    separate = DatabaseManager(str(tmp_path / 'other.db'))
+    try:
+        assert other._write_lock is db._write_lock
+        assert separate._write_lock is not db._write_lock
+    finally:
+        other.close()
+        separate.close()
+
+
+def test_short_lived_threads_reuse_pooled_connections(db):
+    """Test that per-request style threads share connections instead of opening their own."""
+    db.insert_jobs([make_job(1)])
+
+    def request():
+        assert db.search_jobs()[1] == 1
+        assert db.get_statistics()['total_jobs'] == 1
+
+    for _ in range(5):
+        thread = threading.Thread(target=request)
+        thread.start()
+        thread.join()
+
+    assert len(db._connections) == 1
+
+
+def test_lazy_rows_return_their_connection(db):
+    """Test that abandoned and exhausted row iterators hand the connection back."""
+    db.insert_jobs([make_job(i) for i in range(3)])
+
+    _, rows = db.iter_search_rows(per_page=10)
+    next(rows)
+    del rows
+    _, rows = db.iter_search_rows(per_page=10)
+    assert len(list(rows)) == 3
+    _, rows, total = db.search_rows_with_total(per_page=1)
+    rows.close()
+
+    assert total == 3
+    assert len(db._connections) == 1
+    assert db._pool.qsize() == 1
+
+
+def test_connection_pool_is_bounded(db):
+    """Test that connections beyond the pool size are closed when released."""
+    checked_out = [db._acquire_connection() for _ in range(CONNECTION_POOL_SIZE + 2)]
+    for conn in checked_out:
+        db._release_connection(conn)
+
+    assert db._pool.qsize() == len(db._connections) == CONNECTION_POOL_SIZE
+    with pytest.raises(sqlite3.ProgrammingError):
+        checked_out[-1].execute("SELECT 1")
+
+
+def test_migrates_baseline_database(tmp_path):
+    """Test that a database from the first release is upgraded in place."""
+    path = str(tmp_path / 'baseline.db')
+    conn = sqlite3.connect(path)
+    conn.execute(BASELINE_SCHEMA)
+    conn.execute(
+        "INSERT INTO jobs (site, job_url, title, location, date_posted, is_remote, min_amount, description) "
+        "VALUES ('indeed', 'https://example.com/jobs/1', 'Legacy Python Job', 'Bangkok', '2024-02-01', 1, 500, 'plain')"
+    )
+    conn.execute(
+        "INSERT INTO jobs (site, job_url, title, location) VALUES ('linkedin', 'https://example.com/x', 'Paris Job', 'Paris')"
+    )
+    conn.commit()
+    conn.close()
+
+    db = DatabaseManager(path)
+    try:
+        conn = sqlite3.connect(path)
+        columns = {row[1] for row in conn.execute("PRAGMA table_xinfo(jobs)")}
+        legacy = conn.execute(
+            "SELECT country, url_hash, date_posted_ts, salary_display FROM jobs WHERE id = 1"
+        ).fetchone()
+        conn.close()
+
+        assert {'country', 'url_hash', 'date_posted_ts', 'salary_display'} <= columns
+        assert legacy[0] == 'Thailand' and legacy[1] is not None and legacy[2] is not None
+        assert legacy[3] == 'USD 500+'
+
+        # Counters are seeded and the full-text index covers the existing rows
+        _assert_stats_current(db)
+        assert _ids(db, {'title': 'legacy'}) == {1}
+        assert _ids(db, {'country': 'Thailand'}) == {1}
+
+        # Existing postings dedupe through the backfilled url_hash
+        assert db.insert_jobs([{'site': 'indeed', 'job_url': 'https://example.com/jobs/1', 'title': 'Again',
+                                'location': 'Bangkok'}]) == 0
+        assert db.insert_jobs([make_job(2, location='Hanoi')]) == 1
+        _assert_stats_current(db)
+    finally:
+        db.close()
+
+    # Reopening a migrated database is a no-op
+    DatabaseManager(path).close()
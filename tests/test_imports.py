@@ -1,55 +1,42 @@
 """
-Basic import tests for LokerPuller.
+Import smoke tests for LokerPuller.
+
+These only prove that modules compile and import; behaviour is covered by
+test_database.py, test_api.py, test_validation.py and test_session_pool.py.
 """
 
-import pytest
+import compileall
+import importlib
+import pkgutil
 
+import lokerpuller
 
-def test_core_imports():
-    """Test that core modules can be imported."""
-    from lokerpuller.core.scraper import JobScraper
-    from lokerpuller.core.scheduler import JobScheduler
-    
-    assert JobScraper is not None
-    assert JobScheduler is not None
 
+def test_all_modules_compile():
+    """Test that every module in the package compiles."""
+    assert compileall.compile_dir(lokerpuller.__path__[0], quiet=1)
 
-def test_database_imports():
-    """Test that database modules can be imported."""
-    from lokerpuller.database.manager import DatabaseManager
-    from lokerpuller.database.models import Job
-    
-    assert DatabaseManager is not None
-    assert Job is not None
 
+def test_all_modules_import():
+    """Test that every module in the package imports, in one interpreter."""
+    for module_info in pkgutil.walk_packages(lokerpuller.__path__, 'lokerpuller.'):
+        importlib.import_module(module_info.name)
 
-def test_utils_imports():
-    """Test that utility modules can be imported."""
+
+def test_public_entry_points():
+    """Test that the main entry points are exposed where callers expect them."""
+    from lokerpuller.core.scraper import JobScraper
+    from lokerpuller.core.scheduler import JobScheduler
+    from lokerpuller.database.manager import DatabaseManager
+    from lokerpuller.database.models import Job
     from lokerpuller.utils.constants import SEA_COUNTRIES
     from lokerpuller.utils.validation import validate_sea_country
     from lokerpuller.utils.logging import get_logger
-    
-    assert SEA_COUNTRIES is not None
-    assert validate_sea_country is not None
-    assert get_logger is not None
-
-
-def test_api_imports():
-    """Test that API modules can be imported."""
     from lokerpuller.api.app import create_app
-    
-    assert create_app is not None
-
-
-def test_config_imports():
-    """Test that config modules can be imported."""
     from lokerpuller.config.settings import get_settings
-    
-    assert get_settings is not None
-
-
-def test_cli_imports():
-    """Test that CLI module can be imported."""
     from lokerpuller.cli import main
-    
-    assert main is not None 
\ No newline at end of file
+
+    for entry_point in (JobScraper, JobScheduler, DatabaseManager, Job, SEA_COUNTRIES,
+                        validate_sea_country, get_logger, create_app, get_settings, main):
+        assert entry_point is not None
+    assert lokerpuller.DatabaseManager is DatabaseManager
@@ -0,0 +1,85 @@
+"""
+Tests for buffered log files written by the command line entry points.
+"""
+
+import logging
+import os
+import signal
+import subprocess
+import sys
+import textwrap
+
+import lokerpuller
+from lokerpuller.utils.logging import setup_logging, shutdown_logging
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(lokerpuller.__file__)))
+
+
+def _env(tmp_path) -> dict:
+    """Environment pointing the settings at tmp_path."""
+    env = dict(os.environ, DB_PATH=str(tmp_path / 'jobs.db'), LOG_PATH=str(tmp_path / 'logs'))
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [PROJECT_ROOT, env.get('PYTHONPATH')]))
+    return env
+
+
+def test_cli_writes_its_log_file_on_exit(tmp_path):
+    """Test that a CLI command's buffered log records reach its log file at exit."""
+    result = subprocess.run(
+        [sys.executable, '-m', 'lokerpuller.cli', 'schedule', 'cleanup'],
+        env=_env(tmp_path), cwd=tmp_path, capture_output=True, text=True, timeout=60
+    )
+    assert result.returncode == 0, result.stderr
+
+    log_text = (tmp_path / 'logs' / 'scheduler.log').read_text(encoding='utf-8')
+    assert 'LokerPuller Cleanup Started' in log_text
+    assert 'Cleanup completed successfully' in log_text
+
+
+def test_sigterm_flushes_buffered_log_records(tmp_path):
+    """Test that SIGTERM after exit_cleanly_on_sigterm still writes buffered records."""
+    log_file = tmp_path / 'logs' / 'signal.log'
+    script = textwrap.dedent(f'''
+        import sys, time
+        from lokerpuller.utils.logging import exit_cleanly_on_sigterm, setup_logging
+        logger = setup_logging(log_file={str(log_file)!r})
+        exit_cleanly_on_sigterm()
+        logger.info('record before SIGTERM')
+        print('ready', flush=True)
+        time.sleep(60)
+    ''')
+    process = subprocess.Popen(
+        [sys.executable, '-c', script], env=_env(tmp_path), cwd=tmp_path,
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+    )
+    try:
+        assert process.stdout.readline().strip() == 'ready'
+        process.send_signal(signal.SIGTERM)
+        assert process.wait(timeout=30) == 128 + signal.SIGTERM
+    finally:
+        process.kill()
+        process.stdout.close()
+
+    assert 'record before SIGTERM' in log_file.read_text(encoding='utf-8')
+
+
+def test_setup_logging_leaves_foreign_root_handlers_alone(tmp_path):
+    """Test that handlers installed by others stay on the root logger and run synchronously."""
+    root_logger = logging.getLogger()
+    records = []
+    foreign = logging.Handler()
+    foreign.emit = records.append
+    root_logger.addHandler(foreign)
+    before = list(root_logger.handlers)
+
+    logger = logging.getLogger('LokerPuller.TestForeign')
+    try:
+        setup_logging(name=logger.name, log_file=str(tmp_path / 'logs' / 'test.log'))
+        assert root_logger.handlers == before
+
+        logging.getLogger('werkzeug').warning('served synchronously')
+        assert [record.getMessage() for record in records] == ['served synchronously']
+    finally:
+        root_logger.removeHandler(foreign)
+        shutdown_logging()
+        logger.handlers.clear()
+        logger.propagate = True
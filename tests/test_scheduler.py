@@ -0,0 +1,47 @@
+"""
+Tests for the daily scraping schedule.
+"""
+
+import threading
+import time
+
+from lokerpuller.config.settings import get_settings
+from lokerpuller.core.scheduler import JobScheduler
+from lokerpuller.core.scraper import JobScraper
+from lokerpuller.utils.constants import MEMORY_OPTIMIZED_CONFIG, SEA_SCRAPING_CONFIG
+
+
+def test_daily_scraping_caps_concurrent_site_scrapes(tmp_path, monkeypatch):
+    """Test that concurrent countries share one max_concurrent_sites budget."""
+    monkeypatch.setenv('DB_PATH', str(tmp_path / 'jobs.db'))
+    monkeypatch.setenv('LOG_PATH', str(tmp_path / 'logs'))
+    get_settings.cache_clear()
+    monkeypatch.setattr(time, 'sleep', lambda seconds: None)
+
+    lock = threading.Lock()
+    in_flight = set()
+    peak = 0
+    overlapping_countries = False
+
+    def fake_scrape(self, site, search_term, location, **kwargs):
+        nonlocal peak, overlapping_countries
+        key = (location, site, threading.get_ident())
+        with lock:
+            in_flight.add(key)
+            peak = max(peak, len(in_flight))
+            overlapping_countries |= len({entry[0] for entry in in_flight}) > 1
+        threading.Event().wait(0.01)
+        with lock:
+            in_flight.discard(key)
+        return []
+
+    monkeypatch.setattr(JobScraper, 'scrape_site_with_logging', fake_scrape)
+    try:
+        result = JobScheduler().run_daily_scraping()
+    finally:
+        get_settings.cache_clear()
+
+    expected_jobs = sum(len(config['search_terms']) for config in SEA_SCRAPING_CONFIG.values())
+    assert result['successful_jobs'] == result['total_jobs'] == expected_jobs
+    assert peak <= MEMORY_OPTIMIZED_CONFIG['max_concurrent_sites']
+    assert overlapping_countries
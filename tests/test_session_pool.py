@@ -0,0 +1,61 @@
+"""
+Tests for the jobspy idle-session pool.
+"""
+
+import pytest
+
+from jobspy import util
+from jobspy.linkedin import LinkedIn
+from jobspy.linkedin.constant import headers as linkedin_headers
+from jobspy.naukri import Naukri
+from jobspy.naukri.constant import headers as naukri_headers
+
+
+@pytest.fixture(autouse=True)
+def empty_pool():
+    """Start and finish every test with no idle sessions."""
+    util._idle_sessions.clear()
+    yield
+    util._idle_sessions.clear()
+
+
+def test_released_linkedin_session_is_not_reused_by_naukri():
+    """Test that a LinkedIn session never carries its headers into a Naukri scrape."""
+    linkedin = LinkedIn()
+    linkedin.session.cookies.set('li_at', 'secret')
+    util.release_session(linkedin.session)
+
+    naukri = Naukri()
+
+    assert naukri.session is not linkedin.session
+    assert naukri.session.headers['authority'] == naukri_headers['authority']
+    assert 'li_at' not in naukri.session.cookies
+
+
+def test_released_session_comes_back_clean():
+    """Test that a released session returns with default headers and no cookies."""
+    first = LinkedIn()
+    first.session.headers['csrf-token'] = 'stale'
+    first.session.cookies.set('li_at', 'secret')
+    util.release_session(first.session)
+
+    # The pooled session is reset on release, before any scraper picks it up
+    pooled = first.session
+    assert 'csrf-token' not in pooled.headers
+    assert 'authority' not in pooled.headers
+    assert len(pooled.cookies) == 0
+
+    second = LinkedIn()
+
+    assert second.session is pooled
+    assert second.session.headers['authority'] == linkedin_headers['authority']
+    assert 'csrf-token' not in second.session.headers
+
+
+def test_sessions_without_site_are_not_pooled():
+    """Test that sessions created without a site are never handed out again."""
+    session = util.create_session(is_tls=False)
+    util.release_session(session)
+
+    assert util.create_session(is_tls=False) is not session
+    assert not util._idle_sessions
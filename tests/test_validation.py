@@ -0,0 +1,125 @@
+"""
+Tests for job sanitization and SEA location matching.
+"""
+
+import random
+
+import pandas as pd
+
+from lokerpuller.core.scraper import optimize_dtypes
+from lokerpuller.utils.constants import JOB_COLUMNS
+from lokerpuller.utils.validation import (
+    get_sea_country, sanitize_job_batch, sanitize_job_data, sanitize_job_frame, sanitize_job_row,
+    validate_search_params, validate_sea_country
+)
+
+
+def _random_jobs(count: int, seed: int = 2) -> list:
+    """Build raw job dictionaries mixing strings, numbers, booleans and None."""
+    rng = random.Random(seed)
+    text_values = [None, ' a ', 'Jakarta, Indonesia', 'Paris', 5, 100, 'Bangkok', 2.5]
+    number_values = [None, 1, 2.5, '3', 'x', ' 4 ']
+    flag_values = [None, True, False, 'yes', 'TRUE', 1, 0, 'no']
+    
+    jobs = []
+    for i in range(count):
+        job = {
+            'site': rng.choice(['indeed', 'linkedin']),
+            'job_url': f'https://example.com/{i}',
+            'title': rng.choice(['t', ' x ', 42]),
+            'company': 'ignored',
+        }
+        for field in ('location', 'company_name', 'description', 'date_posted', 'skills'):
+            if rng.random() < .8:
+                job[field] = rng.choice(text_values)
+        for field in ('min_amount', 'max_amount', 'company_rating'):
+            if rng.random() < .8:
+                job[field] = rng.choice(number_values)
+        if rng.random() < .8:
+            job['is_remote'] = rng.choice(flag_values)
+        jobs.append(job)
+    return jobs
+
+
+def test_sanitize_job_batch_matches_sanitize_job_row():
+    """Test that the vectorized batch path gives the per-job rows, values and types."""
+    jobs = _random_jobs(400)
+    
+    rows = sanitize_job_batch(jobs)
+    
+    assert len(rows) == len(jobs)
+    for job, row in zip(jobs, rows):
+        expected = sanitize_job_row(job)
+        assert [(value, type(value)) for value in row] == [(value, type(value)) for value in expected], job
+
+
+def test_sanitize_job_batch_keeps_integer_text():
+    """Test that an int in a text column next to a None is not stored as '100.0'."""
+    rows = sanitize_job_batch([
+        {'site': 'indeed', 'job_url': 'u1', 'title': 't', 'company_name': 100},
+        {'site': 'indeed', 'job_url': 'u2', 'title': 't', 'company_name': None},
+    ])
+    
+    company = JOB_COLUMNS.index('company_name')
+    assert rows[0][company] == '100'
+    assert rows[1][company] is None
+
+
+def test_sanitize_job_batch_blanks_missing_required_fields():
+    """Test that a None required field becomes '' on the batch path, as documented."""
+    job = {'site': 'indeed', 'job_url': 'u', 'title': None}
+    
+    title = JOB_COLUMNS.index('title')
+    assert sanitize_job_batch([job])[0][title] == ''
+    assert sanitize_job_row(job)[title] == 'None'
+
+
+def test_sanitize_job_data_is_row_as_dict():
+    """Test that sanitize_job_data maps JOB_COLUMNS onto sanitize_job_row."""
+    job = _random_jobs(1)[0]
+    
+    assert sanitize_job_data(job) == dict(zip(JOB_COLUMNS, sanitize_job_row(job)))
+
+
+def test_get_sea_country():
+    """Test that SEA countries and cities map to their country as whole words."""
+    assert get_sea_country('Jakarta, Indonesia') == 'Indonesia'
+    assert get_sea_country('  kuala lumpur ') == 'Malaysia'
+    assert get_sea_country('Remote - Ho Chi Minh City') == 'Vietnam'
+    assert get_sea_country('Indonesian food') is None
+    assert get_sea_country('Paris') is None
+    assert get_sea_country(None) is None
+    assert validate_sea_country('SINGAPORE')
+    assert not validate_sea_country('')
+
+
+def test_validate_search_params():
+    """Test that search parameters are checked for emptiness, range and region."""
+    assert validate_search_params('developer', 'Bangkok, Thailand', 10) == (True, '')
+    assert not validate_search_params(' ', 'Thailand', 10)[0]
+    assert validate_search_params('developer', '  ', 10) == (False, 'Location cannot be empty')
+    assert not validate_search_params('developer', 'Thailand', 0)[0]
+    assert not validate_search_params('developer', 'Thailand', 201)[0]
+    assert not validate_search_params('developer', 'Paris, France', 10)[0]
+
+
+def test_sanitize_job_frame_accepts_optimized_dtypes():
+    """Test that downcast and categorical columns sanitize like the raw frame, null site included."""
+    raw = pd.DataFrame({
+        'site': ['indeed', None, 'linkedin'],
+        'job_url': ['https://example.com/1', 'https://example.com/2', None],
+        'title': [' Engineer ', 'Analyst', None],
+        'company': ['Acme', None, 'Beta'],
+        'location': ['Jakarta, Indonesia', 'Bangkok', None],
+        'job_type': ['fulltime', None, 'contract'],
+        'currency': ['IDR', None, 'USD'],
+        'min_amount': [100.0, None, 2.5],
+        'is_remote': [True, False, None],
+    })
+    
+    rows = sanitize_job_frame(optimize_dtypes(raw.copy()))
+    
+    assert rows == sanitize_job_frame(raw)
+    assert rows[1][JOB_COLUMNS.index('site')] == ''
+    assert rows[2][JOB_COLUMNS.index('job_url')] == ''
+    assert rows[0][JOB_COLUMNS.index('min_amount')] == 100.0